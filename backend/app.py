@@ -1,16 +1,134 @@
 """Flask application entry point"""
-from flask import Flask
+from datetime import date
+from decimal import Decimal
+from io import BytesIO
+from typing import Any, Union
+from flask import Flask, Response, request
+from flask.json.provider import JSONProvider
 from flask_cors import CORS
+from werkzeug.exceptions import BadRequest, RequestEntityTooLarge
+from werkzeug.http import http_date
 from .routes import transaction_routes, marketplace_routes
+import gzip
 import os
+import zlib
+import orjson
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
+def _json_default(obj: Any) -> Any:
+    """Serialize the types orjson leaves to us, the same way Flask does"""
+    if isinstance(obj, date):
+        return http_date(obj)
+    if isinstance(obj, Decimal):
+        return str(obj)
+    if hasattr(obj, "__html__"):
+        return str(obj.__html__())
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+class OrjsonProvider(JSONProvider):
+    """JSON provider backed by orjson.
+    
+    Output matches Flask's default provider (sorted keys, HTTP dates for
+    datetimes) but is encoded in C straight to bytes.
+    """
+    
+    option = orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+    
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        return orjson.dumps(obj, default=_json_default, option=self.option).decode()
+    
+    def loads(self, s: Union[str, bytes], **kwargs: Any) -> Any:
+        return orjson.loads(s)
+    
+    def response(self, *args: Any, **kwargs: Any) -> Response:
+        obj = self._prepare_response_obj(args, kwargs)
+        body = orjson.dumps(obj, default=_json_default, option=self.option)
+        return self._app.response_class(body, mimetype="application/json")
+
+# Responses smaller than this are not worth compressing
+GZIP_MIN_SIZE = 1024
+
+# Largest gzip request body accepted, before or after inflation
+GZIP_MAX_SIZE = 16 * 1024 * 1024
+
+class GzipRequestMiddleware:
+    """WSGI middleware that inflates gzip-encoded request bodies.
+    
+    Routes keep calling ``request.get_json()`` and never see the encoding.
+    Bodies are inflated at most ``max_size`` bytes at a time, so a small
+    compressed payload cannot expand into an arbitrarily large one.
+    """
+    
+    def __init__(self, wsgi_app, max_size: int = GZIP_MAX_SIZE):
+        self.wsgi_app = wsgi_app
+        self.max_size = max_size
+    
+    def _inflate(self, compressed: bytes) -> bytes:
+        """Inflate a gzip body, refusing output beyond max_size"""
+        inflater = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        try:
+            body = inflater.decompress(compressed, self.max_size + 1)
+        except zlib.error:
+            raise BadRequest("Invalid gzip request body")
+        if len(body) > self.max_size:
+            raise RequestEntityTooLarge()
+        if not inflater.eof:
+            raise BadRequest("Invalid gzip request body")
+        return body
+    
+    def __call__(self, environ, start_response):
+        if environ.get("HTTP_CONTENT_ENCODING", "").lower() == "gzip":
+            length = int(environ.get("CONTENT_LENGTH") or 0)
+            try:
+                if length > self.max_size:
+                    raise RequestEntityTooLarge()
+                body = self._inflate(environ["wsgi.input"].read(length))
+            except (BadRequest, RequestEntityTooLarge) as e:
+                return e(environ, start_response)
+            environ["wsgi.input"] = BytesIO(body)
+            environ["CONTENT_LENGTH"] = str(len(body))
+            del environ["HTTP_CONTENT_ENCODING"]
+        return self.wsgi_app(environ, start_response)
+
+def gzip_response(response: Response) -> Response:
+    """Compress large responses for clients that accept gzip
+    
+    The gzip and identity bodies are different byte sequences, so a strong
+    ETag computed on the identity body is weakened for these clients. That
+    also covers 304s, which cannot know which encoding the client holds.
+    """
+    if (
+        response.direct_passthrough
+        or "Content-Encoding" in response.headers
+        or "gzip" not in request.headers.get("Accept-Encoding", "").lower()
+    ):
+        return response
+    
+    etag, weak = response.get_etag()
+    if etag and not weak:
+        response.set_etag(etag, weak=True)
+        response.vary.add("Accept-Encoding")
+    
+    if response.status_code < 200 or response.status_code >= 300:
+        return response
+    
+    data = response.get_data()
+    if len(data) < GZIP_MIN_SIZE:
+        return response
+    
+    response.set_data(gzip.compress(data, compresslevel=5))
+    response.headers["Content-Encoding"] = "gzip"
+    response.vary.add("Accept-Encoding")
+    return response
+
 def create_app(config_name=None):
     """Create and configure the Flask application."""
     app = Flask(__name__)
+    app.json = OrjsonProvider(app)
+    app.after_request(gzip_response)
     CORS(app)
 
     # Get MongoDB URI and database name
@@ -31,6 +149,8 @@ def create_app(config_name=None):
             'XRPL_NODE_URL': os.getenv('XRPL_NODE_URL')
         })
 
+    app.wsgi_app = GzipRequestMiddleware(app.wsgi_app)
+
     # Register blueprints
     app.register_blueprint(transaction_routes.bp)
     app.register_blueprint(marketplace_routes.bp)
@@ -20,6 +20,9 @@ from backend.services.xrpl_service import (
     get_nft_id_from_account
 )
 from datetime import datetime
+import logging
+
+logger = logging.getLogger(__name__)
 
 bp = Blueprint('marketplace', __name__, url_prefix='/api/marketplace')
 
@@ -36,7 +39,7 @@ def get_active_offers() -> Tuple[Response, int]:
         
         # Enrich each offer with metadata
         for offer in offers:
-            print(offer)
+            logger.debug("Active offer: %s", offer)
             if 'nft_id' in offer:
                 metadata = get_metadata_with_image_by_id(offer['nft_id'])
                 if metadata:
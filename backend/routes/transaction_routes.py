@@ -1,9 +1,10 @@
 """Transaction routes for handling XRPL transactions"""
-from typing import Tuple
+from typing import Tuple, Union
 from flask import Blueprint, jsonify, request, Response
 from backend.services.xrpl_service import (
     generate_nft_mint_template,
     verify_xrpl_transaction,
+    submit_signed_transactions,
 )
 from backend.services.mongodb_service import (
     get_account_nfts,
@@ -142,8 +143,44 @@ def submit_transaction() -> Tuple[Response, int]:
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+@bp.route('/submit/batch', methods=['POST'])
+def submit_transaction_batch() -> Tuple[Response, int]:
+    """Submit several client-signed transactions in one request
+    
+    Expected request body:
+    {
+        "account": str,                  # XRPL account that signed them
+        "signed_transactions": [         # One entry per transaction
+            {"tx_blob": str, "hash": str, "sequence": int}
+        ]
+    }
+    """
+    try:
+        data = request.get_json()
+        
+        # Validate required fields
+        if not data.get('account'):
+            return jsonify({'error': 'account is required'}), 400
+        signed_txs = data.get('signed_transactions')
+        if not signed_txs:
+            return jsonify({'error': 'signed_transactions is required'}), 400
+        if any(not tx.get('tx_blob') for tx in signed_txs):
+            return jsonify({'error': 'Every transaction needs a tx_blob'}), 400
+        
+        results = submit_signed_transactions(signed_txs, data['account'])
+        
+        return jsonify({
+            'status': 'success' if all(r['status'] == 'success' for r in results) else 'partial',
+            'results': results,
+            'count': len(results)
+        }), 200
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
 @bp.route('/nfts/<address>', methods=['GET'])
-def get_address_nfts(address: str) -> Tuple[Response, int]:
+def get_address_nfts(address: str) -> Union[Response, Tuple[Response, int]]:
     """Get all NFTs for an address with their full metadata"""
     try:
         # Get NFTs with metadata already included from MongoDB
@@ -165,11 +202,14 @@ def get_address_nfts(address: str) -> Tuple[Response, int]:
             }
             formatted_nfts.append(formatted_nft)
         
-        return jsonify({
+        response = jsonify({
             'nfts': formatted_nfts,
             'count': len(formatted_nfts),
             'address': address
-        }), 200
+        })
+        # Let clients revalidate with If-None-Match and get a 304 when nothing changed
+        response.add_etag()
+        return response.make_conditional(request)
     except ValueError as e:
         return jsonify({'error': str(e)}), 400
     except Exception as e:
@@ -1,21 +1,58 @@
 """MongoDB service for NFT tracking"""
 from typing import Dict, Any, List, Tuple, Optional
+from functools import lru_cache
 from pymongo import MongoClient
 import os
 from datetime import datetime
 import uuid
 import json
 import hashlib
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+# Set once ensure_indexes() has been triggered for this process
+_indexes_ensured = False
+# Reentrant: ensure_indexes() calls get_db() while the lock is held
+_indexes_lock = threading.RLock()
+
+@lru_cache(maxsize=None)
+def _client_for(mongo_uri: str) -> MongoClient:
+    """Create the MongoDB client for a URI, once per process"""
+    return MongoClient(mongo_uri)
 
 def get_db():
-    """Get MongoDB database connection"""
+    """Get MongoDB database connection
+    
+    The underlying MongoClient owns a connection pool and is created lazily
+    on first use, then shared by every call in the process. Creating it on
+    first use rather than at import keeps it fork-safe under gunicorn
+    --preload. Indexes are ensured on that first use too, instead of at
+    import time. Tests should patch get_db rather than the client.
+    """
     mongo_uri = os.getenv("MONGODB_URI", "mongodb://localhost:27017/")
-    print(mongo_uri)
-    client = MongoClient(mongo_uri)
+    client = _client_for(mongo_uri)
     db_name = os.getenv("MONGODB_DB", "rwa")
-    print(db_name)
+    logger.debug("Using MongoDB database %s", db_name)
+    if not _indexes_ensured:
+        _ensure_indexes_once()
     return client[db_name]
 
+def _ensure_indexes_once():
+    """Run ensure_indexes() once per process, even when first requests race"""
+    global _indexes_ensured
+    with _indexes_lock:
+        if _indexes_ensured:
+            return
+        # Flag first: ensure_indexes() itself calls get_db()
+        _indexes_ensured = True
+        try:
+            ensure_indexes()
+        except ValueError:
+            _indexes_ensured = False
+            raise
+
 def compute_metadata_hash(metadata: Dict[str, Any]) -> str:
     """Compute a deterministic hash of metadata."""
     # Sort keys for consistent hashing
@@ -341,6 +378,9 @@ def ensure_indexes():
         # Create index for images collection
         image_collection.create_index("image_id", unique=True)
         
+        # Create indexes for offers collection
+        ensure_offer_indexes()
+        
         return True
     except Exception as e:
         raise ValueError(f"Failed to create indexes: {str(e)}")
@@ -571,20 +611,6 @@ def ensure_offer_indexes():
     except Exception as e:
         raise ValueError(f"Failed to create offer indexes: {str(e)}")
 
-# Add offer indexes to initialization
-def ensure_indexes():
-    """Ensure all required indexes exist in MongoDB"""
-    try:
-        db = get_db()
-        # ... existing indexes ...
-        
-        # Add offer indexes
-        ensure_offer_indexes()
-        
-        return True
-    except Exception as e:
-        raise ValueError(f"Failed to create indexes: {str(e)}")
-
 def store_nft_image(image_data: str) -> str:
     """Store an NFT image in the database.
     
@@ -647,10 +673,10 @@ def get_metadata_with_image_by_id(nft_id: str) -> Dict[str, Any]:
     try:
         db = get_db()
         # query the database with the nft_id to get the metadata_hash then query the database with the metadata_hash to get the metadata
-        print(nft_id)
+        logger.debug("Looking up NFT %s", nft_id)
 
         nft_doc = db.nfts.find_one({"nft_id": nft_id})
-        print(nft_doc)
+        logger.debug("NFT document: %s", nft_doc)
         if not nft_doc:
             raise ValueError(f"nft not found for ID {nft_id}")
             
@@ -723,5 +749,3 @@ def get_all_active_offers() -> List[Dict[str, Any]]:
     except Exception as e:
         raise ValueError(f"Failed to get active offers: {str(e)}")
 
-# Create indexes when module is imported
-ensure_indexes() 
\ No newline at end of file
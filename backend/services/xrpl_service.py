@@ -1,16 +1,35 @@
 """XRPL service for transaction handling"""
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
+from functools import lru_cache
+import logging
 import xrpl
 from xrpl.clients import JsonRpcClient
-from xrpl.models.requests import AccountNFTs, Tx
+from xrpl.models.requests import AccountNFTs, SubmitOnly, Tx
+from xrpl.models.response import ResponseStatus
 import os
 from xrpl.models.transactions import NFTokenMint, Payment, NFTokenCreateOffer
 from xrpl.utils import str_to_hex
 
+logger = logging.getLogger(__name__)
+
+# Engine result prefixes of submissions the server accepted (applied or queued)
+_ACCEPTED_RESULTS = ("tes", "ter")
+
+@lru_cache(maxsize=None)
+def _client_for(node_url: str) -> JsonRpcClient:
+    """Create the XRPL client for a node URL, once per process"""
+    return JsonRpcClient(node_url)
+
 def get_client() -> JsonRpcClient:
-    """Get XRPL client"""
+    """Get XRPL client
+    
+    The client is created lazily on first use and reused afterwards, so
+    it is never built at import time (e.g. before a gunicorn fork).
+    Tests should patch get_client or JsonRpcClient.request rather than
+    relying on a fresh client per call.
+    """
     node_url = os.getenv("XRPL_NODE_URL", "https://s.altnet.rippletest.net:51234")
-    return JsonRpcClient(node_url)
+    return _client_for(node_url)
 
 def generate_nft_mint_template(
     account: str,
@@ -24,8 +43,8 @@ def generate_nft_mint_template(
     try:
         # Convert URI to hex - this is what's actually stored on chain
         hex_uri = str_to_hex(uri)
-        print(f"\nDebug - URI hex length: {len(hex_uri)}")
-        print(f"Debug - URI hex: {hex_uri}")
+        logger.debug("URI hex length: %d", len(hex_uri))
+        logger.debug("URI hex: %s", hex_uri)
         
         # Create the transaction template
         mint_tx = NFTokenMint(
@@ -226,6 +245,58 @@ def verify_nft_ownership(account: str, nft_id: str) -> bool:
         return False
     except Exception as e:
         raise ValueError(f"Failed to verify NFT ownership: {str(e)}")
+
+
+def submit_signed_transaction(signed_tx: Dict[str, Any], account: str) -> Dict[str, Any]:
+    """Submit a transaction blob signed by the client to the XRPL
+    
+    Args:
+        signed_tx: Dict with the signed "tx_blob" and optionally its "hash"
+        account: The account that signed the transaction
+        
+    Returns:
+        Dict with the submission status and the engine result. The status
+        is "success" only when the server accepted the transaction (a tes*
+        or ter* engine result); rejections such as tefPAST_SEQ or tem*
+        are reported as "error".
+    """
+    try:
+        client = get_client()
+        response = client.request(SubmitOnly(tx_blob=signed_tx["tx_blob"]))
+        result = response.result
+        engine_result = result.get("engine_result") or ""
+        accepted = response.status == ResponseStatus.SUCCESS and engine_result.startswith(_ACCEPTED_RESULTS)
+        return {
+            "status": "success" if accepted else "error",
+            "engine_result": result.get("engine_result"),
+            "engine_result_message": result.get("engine_result_message"),
+            "hash": result.get("tx_json", {}).get("hash", signed_tx.get("hash")),
+            "account": account
+        }
+    except Exception as e:
+        raise ValueError(f"Failed to submit transaction: {str(e)}")
+
+def submit_signed_transactions(signed_txs: List[Dict[str, Any]], account: str) -> List[Dict[str, Any]]:
+    """Submit several signed transactions from one account, in sequence order
+    
+    Returns one result per transaction, in the order they were submitted.
+    A transaction that fails to submit gets an error entry and the rest of
+    the batch is still submitted.
+    """
+    ordered = sorted(signed_txs, key=lambda tx: tx.get("sequence", 0))
+    results = []
+    for signed_tx in ordered:
+        try:
+            results.append(submit_signed_transaction(signed_tx, account))
+        except ValueError as e:
+            results.append({
+                "status": "error",
+                "error": str(e),
+                "hash": signed_tx.get("hash"),
+                "account": account
+            })
+    return results
+
 def verify_transaction_signature(signed_tx: Dict[str, Any]) -> bool:
     """Verify the signature of a signed transaction"""
     # Skip verification as it will be handled by the XRPL network
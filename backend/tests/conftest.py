@@ -1,62 +1,35 @@
 import pytest
-import sys
-import os
-from pymongo import MongoClient
+from unittest.mock import MagicMock
 from dotenv import load_dotenv
 
-# Add the backend directory to Python path
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 # Load environment variables
 load_dotenv()
 
-from app import create_app
+from backend.app import create_app
 
-@pytest.fixture
+@pytest.fixture(autouse=True)
+def _no_index_creation(monkeypatch):
+    """Keep get_db() from creating indexes, so mocked tests need no live MongoDB."""
+    monkeypatch.setattr("backend.services.mongodb_service.ensure_indexes", lambda: True)
+
+@pytest.fixture(scope="session")
 def app():
     """Create and configure a test Flask application."""
     app = create_app('testing')
     return app
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def client(app):
     """Create a test client."""
     return app.test_client()
 
 @pytest.fixture
-def db(app):
-    """Create a test database connection."""
-    client = MongoClient(app.config['MONGODB_URI'])
-    db = client[app.config['MONGODB_DB']]
-    
-    # Clear all collections before each test
-    for collection in db.list_collection_names():
-        db[collection].delete_many({})
-    
-    yield db
-    
-    # Clear all collections after each test
-    for collection in db.list_collection_names():
-        db[collection].delete_many({})
-    
-    client.close()
-
-@pytest.fixture
-def mock_xrpl_client():
-    """Create a mock XRPL client."""
-    class MockXRPLClient:
-        def request(self, *args, **kwargs):
-            class MockResponse:
-                def is_successful(self):
-                    return True
-                
-                @property
-                def result(self):
-                    return {"engine_result": "tesSUCCESS"}
-            
-            return MockResponse()
-    
-    return MockXRPLClient()
+def mock_xrpl_request(monkeypatch):
+    """Patch XRPL client requests to return a successful mock response."""
+    mock_request = MagicMock()
+    mock_request.return_value.is_successful.return_value = True
+    monkeypatch.setattr("xrpl.clients.JsonRpcClient.request", mock_request)
+    return mock_request
 
 @pytest.fixture
 def test_nft():
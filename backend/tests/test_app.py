@@ -0,0 +1,102 @@
+import gzip
+import orjson
+import pytest
+from backend.app import GZIP_MAX_SIZE
+
+BATCH_URL = '/api/transaction/submit/batch'
+NFTS_URL = '/api/transaction/nfts/rTestAddress123'
+GZIP = {'Accept-Encoding': 'gzip'}
+
+@pytest.fixture
+def stored_nfts(monkeypatch, test_nft):
+    """Serve a configurable number of NFTs from the NFT list route."""
+    nfts = []
+    monkeypatch.setattr('backend.routes.transaction_routes.get_account_nfts', lambda address: nfts)
+    def set_count(count):
+        nfts[:] = [{**test_nft, 'nft_id': f'nft-{i}'} for i in range(count)]
+    return set_count
+
+def _post_gzip(client, body: bytes):
+    """POST a raw body to the batch route, declared as gzip-encoded."""
+    return client.post(
+        BATCH_URL,
+        data=body,
+        headers={'Content-Encoding': 'gzip', 'Content-Type': 'application/json'}
+    )
+
+def test_gzip_request_is_inflated(client):
+    """Test that a gzip body reaches the route as plain JSON."""
+    response = _post_gzip(client, gzip.compress(orjson.dumps({'signed_transactions': []})))
+    assert response.status_code == 400
+    assert response.get_json() == {'error': 'account is required'}
+
+def test_gzip_request_over_limit(client):
+    """Test that a body inflating past GZIP_MAX_SIZE is rejected."""
+    bomb = gzip.compress(b' ' * (GZIP_MAX_SIZE + 1))
+    assert len(bomb) < GZIP_MAX_SIZE
+
+    response = _post_gzip(client, bomb)
+    assert response.status_code == 413
+
+def test_gzip_request_malformed(client):
+    """Test that a body that is not gzip is rejected."""
+    response = _post_gzip(client, b'not gzip at all')
+    assert response.status_code == 400
+
+def test_gzip_request_truncated(client):
+    """Test that a gzip stream cut short is rejected."""
+    body = gzip.compress(orjson.dumps({'account': 'rTestAddress123'}))
+    response = _post_gzip(client, body[:len(body) // 2])
+    assert response.status_code == 400
+
+def test_gzip_response_large_body(client, stored_nfts):
+    """Test that a large response is compressed for gzip-accepting clients."""
+    stored_nfts(20)
+    response = client.get(NFTS_URL, headers=GZIP)
+    assert response.status_code == 200
+    assert response.headers['Content-Encoding'] == 'gzip'
+    assert 'Accept-Encoding' in response.vary
+    assert orjson.loads(gzip.decompress(response.data))['count'] == 20
+
+def test_gzip_response_small_body(client, stored_nfts):
+    """Test that a response below the size threshold is sent as is."""
+    stored_nfts(1)
+    response = client.get(NFTS_URL, headers=GZIP)
+    assert response.status_code == 200
+    assert 'Content-Encoding' not in response.headers
+    assert response.get_json()['count'] == 1
+
+def test_gzip_response_not_accepted(client, stored_nfts):
+    """Test that clients without gzip in Accept-Encoding get a plain body."""
+    stored_nfts(20)
+    response = client.get(NFTS_URL)
+    assert 'Content-Encoding' not in response.headers
+    assert response.get_json()['count'] == 20
+
+def test_gzip_response_weak_etag(client, stored_nfts):
+    """Test that the gzip body does not share a strong ETag with the plain one."""
+    stored_nfts(20)
+    plain = client.get(NFTS_URL)
+    compressed = client.get(NFTS_URL, headers=GZIP)
+    assert plain.get_etag() == (plain.get_etag()[0], False)
+    assert compressed.get_etag() == (plain.get_etag()[0], True)
+
+def test_gzip_response_not_modified(client, stored_nfts):
+    """Test that revalidating with either ETag gives a 304 to gzip clients."""
+    stored_nfts(20)
+    compressed = client.get(NFTS_URL, headers=GZIP)
+    plain = client.get(NFTS_URL)
+    for etag in (compressed.headers['ETag'], plain.headers['ETag']):
+        response = client.get(NFTS_URL, headers={**GZIP, 'If-None-Match': etag})
+        assert response.status_code == 304
+        assert response.headers['ETag'] == compressed.headers['ETag']
+        assert not response.data
+
+def test_gzip_response_modified(client, stored_nfts):
+    """Test that a changed NFT list is sent in full despite a stale ETag."""
+    stored_nfts(20)
+    etag = client.get(NFTS_URL, headers=GZIP).headers['ETag']
+    stored_nfts(21)
+    response = client.get(NFTS_URL, headers={**GZIP, 'If-None-Match': etag})
+    assert response.status_code == 200
+    assert orjson.loads(gzip.decompress(response.data))['count'] == 21
@@ -1,48 +1,45 @@
 import pytest
 from unittest.mock import patch, MagicMock
-from services.xrpl_service import (
+from backend.services.xrpl_service import (
     verify_nft_ownership,
     submit_signed_transaction
 )
-from services.mongodb_service import (
+from backend.services.mongodb_service import (
     create_listing,
     get_active_listings,
     get_listing,
     get_account_nfts
 )
 
-def test_verify_nft_ownership():
+def test_verify_nft_ownership(mock_xrpl_request):
     """Test NFT ownership verification."""
     test_address = "rTestAddress123"
     test_nft_id = "test-nft-id"
     
-    with patch('xrpl.clients.JsonRpcClient.request') as mock_request:
-        mock_request.return_value.is_successful.return_value = True
-        mock_request.return_value.result = {
-            "account_nfts": [{"NFTokenID": test_nft_id}]
-        }
-        
-        result = verify_nft_ownership(test_address, test_nft_id)
-        assert result is True
+    mock_xrpl_request.return_value.result = {
+        "account_nfts": [{"NFTokenID": test_nft_id}]
+    }
+    
+    result = verify_nft_ownership(test_address, test_nft_id)
+    assert result is True
 
-def test_submit_signed_transaction():
+def test_submit_signed_transaction(mock_xrpl_request):
     """Test transaction submission."""
     test_tx = {
         "tx_blob": "test_blob",
         "hash": "test_hash"
     }
     
-    with patch('xrpl.clients.JsonRpcClient.request') as mock_request:
-        mock_request.return_value.status = "success"
-        mock_request.return_value.result = {
-            "engine_result": "tesSUCCESS",
-            "tx_json": {"hash": "test_hash"}
-        }
-        
-        result = submit_signed_transaction(test_tx, "rTestAddress123")
-        assert result is not None
-        assert result['status'] == "success"
-        assert result['engine_result'] == "tesSUCCESS"
+    mock_xrpl_request.return_value.status = "success"
+    mock_xrpl_request.return_value.result = {
+        "engine_result": "tesSUCCESS",
+        "tx_json": {"hash": "test_hash"}
+    }
+    
+    result = submit_signed_transaction(test_tx, "rTestAddress123")
+    assert result is not None
+    assert result['status'] == "success"
+    assert result['engine_result'] == "tesSUCCESS"
 
 # MongoDB Service Tests
 def test_create_listing():
@@ -80,7 +77,7 @@ def test_get_active_listings():
     }]
     
     with patch('pymongo.collection.Collection.find') as mock_find, \
-         patch('services.mongodb_service.get_metadata_by_hash') as mock_get_metadata:
+         patch('backend.services.mongodb_service.get_metadata_by_hash') as mock_get_metadata:
         mock_find.return_value = mock_listings
         mock_get_metadata.return_value = {
             "metadata": {"title": "Test NFT"},
@@ -126,7 +123,7 @@ def test_get_nfts_by_address():
     }]
     
     with patch('pymongo.collection.Collection.find') as mock_find, \
-         patch('services.mongodb_service.get_metadata_by_id') as mock_get_metadata:
+         patch('backend.services.mongodb_service.get_metadata_by_id') as mock_get_metadata:
         mock_find.return_value = mock_nfts
         mock_get_metadata.return_value = {
             "metadata": {"title": "Test NFT"},
@@ -0,0 +1,101 @@
+from types import SimpleNamespace
+from xrpl.models.response import ResponseStatus
+
+BATCH_URL = '/api/transaction/submit/batch'
+ACCOUNT = 'rTestAddress123'
+
+def _submit_response(engine_result: str = 'tesSUCCESS', tx_hash: str = 'test_hash'):
+    """Build an XRPL submit response as returned by JsonRpcClient.request."""
+    return SimpleNamespace(
+        status=ResponseStatus.SUCCESS,
+        result={'engine_result': engine_result, 'tx_json': {'hash': tx_hash}}
+    )
+
+def test_submit_batch_requires_account(client):
+    """Test that a batch without an account is rejected."""
+    response = client.post(BATCH_URL, json={'signed_transactions': [{'tx_blob': 'blob'}]})
+    assert response.status_code == 400
+    assert response.get_json() == {'error': 'account is required'}
+
+def test_submit_batch_requires_transactions(client):
+    """Test that an empty batch is rejected."""
+    response = client.post(BATCH_URL, json={'account': ACCOUNT, 'signed_transactions': []})
+    assert response.status_code == 400
+    assert response.get_json() == {'error': 'signed_transactions is required'}
+
+def test_submit_batch_requires_tx_blob(client):
+    """Test that every transaction in a batch must carry a tx_blob."""
+    response = client.post(BATCH_URL, json={
+        'account': ACCOUNT,
+        'signed_transactions': [{'tx_blob': 'blob_1'}, {'hash': 'no_blob'}]
+    })
+    assert response.status_code == 400
+    assert response.get_json() == {'error': 'Every transaction needs a tx_blob'}
+
+def test_submit_batch_in_sequence_order(client, mock_xrpl_request):
+    """Test that a batch is submitted in account sequence order."""
+    mock_xrpl_request.side_effect = [_submit_response(tx_hash=h) for h in ('hash_1', 'hash_2', 'hash_3')]
+
+    response = client.post(BATCH_URL, json={
+        'account': ACCOUNT,
+        'signed_transactions': [
+            {'tx_blob': 'blob_3', 'sequence': 12},
+            {'tx_blob': 'blob_1', 'sequence': 10},
+            {'tx_blob': 'blob_2', 'sequence': 11}
+        ]
+    })
+
+    assert response.status_code == 200
+    data = response.get_json()
+    assert data['status'] == 'success'
+    assert data['count'] == 3
+    submitted = [call.args[0].tx_blob for call in mock_xrpl_request.call_args_list]
+    assert submitted == ['blob_1', 'blob_2', 'blob_3']
+
+def test_submit_batch_partial_failure(client, mock_xrpl_request):
+    """Test that one failed transaction does not stop the rest of the batch."""
+    mock_xrpl_request.side_effect = [
+        _submit_response(tx_hash='hash_1'),
+        ConnectionError('node unavailable'),
+        _submit_response(tx_hash='hash_3')
+    ]
+
+    response = client.post(BATCH_URL, json={
+        'account': ACCOUNT,
+        'signed_transactions': [
+            {'tx_blob': 'blob_1', 'hash': 'hash_1', 'sequence': 1},
+            {'tx_blob': 'blob_2', 'hash': 'hash_2', 'sequence': 2},
+            {'tx_blob': 'blob_3', 'hash': 'hash_3', 'sequence': 3}
+        ]
+    })
+
+    assert response.status_code == 200
+    data = response.get_json()
+    assert data['status'] == 'partial'
+    assert [r['status'] for r in data['results']] == ['success', 'error', 'success']
+    assert data['results'][1]['hash'] == 'hash_2'
+    assert 'node unavailable' in data['results'][1]['error']
+    assert mock_xrpl_request.call_count == 3
+
+def test_submit_batch_rejected_engine_result(client, mock_xrpl_request):
+    """Test that a transaction rippled rejects is reported as an error."""
+    mock_xrpl_request.side_effect = [
+        _submit_response(tx_hash='hash_1'),
+        _submit_response(engine_result='tefPAST_SEQ', tx_hash='hash_2'),
+        _submit_response(engine_result='terQUEUED', tx_hash='hash_3')
+    ]
+
+    response = client.post(BATCH_URL, json={
+        'account': ACCOUNT,
+        'signed_transactions': [
+            {'tx_blob': 'blob_1', 'sequence': 1},
+            {'tx_blob': 'blob_2', 'sequence': 2},
+            {'tx_blob': 'blob_3', 'sequence': 3}
+        ]
+    })
+
+    assert response.status_code == 200
+    data = response.get_json()
+    assert data['status'] == 'partial'
+    assert [r['status'] for r in data['results']] == ['success', 'error', 'success']
+    assert data['results'][1]['engine_result'] == 'tefPAST_SEQ'
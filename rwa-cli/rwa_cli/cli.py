@@ -4,31 +4,162 @@ from textual.widgets import Header, Footer, Button, Static, Pretty
 from textual.screen import Screen
 from textual import work
 import requests
-import json
+from requests.adapters import HTTPAdapter
+import httpx
+import ijson
+import orjson
+import gzip
+import hashlib
 import os
+import tempfile
+import contextlib
 import logging
+from logging.handlers import QueueHandler, QueueListener
+import queue
+import atexit
+import threading
+import asyncio
+from collections import deque
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import uuid
 import datetime
 from rich.text import Text
+from rich.markup import escape
+from rich.pretty import pretty_repr
 from xrpl.wallet import Wallet
-from xrpl.clients import JsonRpcClient
+from xrpl.clients import WebsocketClient
 from xrpl.models.transactions import NFTokenMint, NFTokenCreateOffer
 from xrpl.models.requests import AccountInfo
 from xrpl.utils import str_to_hex
+from xrpl.core.addresscodec import is_valid_classic_address
 from xrpl.transaction import sign
-from xrpl.core import binarycodec
 from screens import MintScreen, TransferScreen, WalletSelectionScreen, ImportWalletScreen
 from config import *
 
-# Configure logging
-logging.basicConfig(
-    filename='log.txt',
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(filename)s:%(lineno)d - %(message)s',
+# Configure logging: workers only enqueue records, a listener thread writes them
+_log_queue = queue.SimpleQueue()
+_log_file_handler = logging.FileHandler('log.txt')
+_log_file_handler.setFormatter(logging.Formatter(
+    '%(asctime)s - %(levelname)s - %(filename)s:%(lineno)d - %(message)s',
     datefmt='%Y-%m-%d %H:%M:%S'
-)
+))
+_log_listener = QueueListener(_log_queue, _log_file_handler)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+logging.root.setLevel(logging.INFO)
+logging.root.addHandler(QueueHandler(_log_queue))
 logger = logging.getLogger(__name__)
 
+# Markup templates for the NFT list in view_nfts
+_NFTS_HEADER = "[bold blue]Your NFTs:[/]\n\n"
+_NFT_TMPL = (
+    "[bold green]NFT #{i}[/]\n"
+    "URI: {uri}\n"
+    "Transaction Hash: {transaction_hash}\n"
+    "Status: {status}\n"
+)
+_NFT_METADATA_LINE = "  {}: {}\n"
+# Re-render the NFT list after every this many parsed items
+_NFT_RENDER_BATCH = 50
+
+# Backend request bodies larger than this are sent gzip-compressed
+_GZIP_MIN_SIZE = 1024
+
+# Pre-generated mint URIs; refilled in the background when running low
+_URI_POOL_SIZE = 64
+_URI_POOL_LOW = 16
+
+def _make_uris(count: int) -> list:
+    """Generate placeholder mint URIs from a single urandom read."""
+    raw = os.urandom(16 * count)
+    return [
+        f"ipfs://QmRWA{uuid.UUID(bytes=raw[i:i + 16], version=4).hex}"
+        for i in range(0, len(raw), 16)
+    ]
+
+# Engine result prefixes of submissions that used up their account sequence;
+# anything else (tem*, tef*, tel*, other ter*) leaves it free for reuse
+_SEQUENCE_CONSUMED = ("tes", "tec", "terQUEUED")
+
+# Hash prefix XRPL uses for signed transactions ("TXN\0")
+_TXN_HASH_PREFIX = b"TXN\x00"
+
+def _tx_hash(tx_blob: str) -> str:
+    """Compute a transaction's hash from its signed blob without re-serialising it."""
+    return hashlib.sha512(_TXN_HASH_PREFIX + bytes.fromhex(tx_blob)).digest()[:32].hex().upper()
+
+def _encode_json_body(data: dict):
+    """Serialise a request body, gzip-compressing it when it is large."""
+    body = orjson.dumps(data)
+    headers = {"Content-Type": "application/json"}
+    if len(body) > _GZIP_MIN_SIZE:
+        body = gzip.compress(body)
+        headers["Content-Encoding"] = "gzip"
+    return body, headers
+
+def _check_transfer_input(nft_id: str, destination: str, account: str):
+    """Reject a malformed NFT ID, an invalid destination or a transfer to self."""
+    if not NFT_ID_RE.match(nft_id):
+        raise ValueError(f"Invalid NFT ID: {nft_id}")
+    if not is_valid_classic_address(destination):
+        raise ValueError(f"Invalid destination address: {destination}")
+    if destination == account:
+        raise ValueError("Cannot transfer an NFT to the current wallet")
+
+def _sign_offer(account: str, wallet: Wallet, nft_id: str, destination: str, sequence: int) -> dict:
+    """Sign a zero-amount sell offer of nft_id to destination and return its submit entry."""
+    offer_tx = NFTokenCreateOffer(
+        account=account,
+        nftoken_id=nft_id,
+        destination=destination,
+        amount="0",  # 0 for a transfer (not a sale)
+        flags=1,  # tfSellNFToken flag
+        sequence=sequence,
+        fee="10"  # Standard fee in drops
+    )
+    tx_blob = sign(offer_tx, wallet).blob()
+    return {
+        "tx_blob": tx_blob,
+        "hash": _tx_hash(tx_blob),
+        "sequence": sequence,
+        "account": account
+    }
+
+def _render_result(result) -> str:
+    """Pretty-print a backend result as markup-safe text, off the UI thread."""
+    return escape(pretty_repr(result))
+
+def _write_json_atomic(path: str, data: dict):
+    """Write JSON through a temp file so readers never see a partial file.
+    
+    Each write gets its own temp file next to path, so concurrent writers
+    (e.g. two cache_balance calls) cannot clobber each other's data.
+    """
+    tmp = tempfile.NamedTemporaryFile(
+        dir=os.path.dirname(path) or ".",
+        prefix=f".{os.path.basename(path)}.",
+        suffix=".tmp",
+        delete=False
+    )
+    try:
+        with tmp as f:
+            f.write(orjson.dumps(data))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp.name, path)
+    except BaseException:
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(tmp.name)
+        raise
+
+def _index_entry(wallet_data: dict) -> dict:
+    """Keep only what the wallet list needs; seeds stay in the wallet files."""
+    return {
+        "classic_address": wallet_data["classic_address"],
+        "last_balance": wallet_data.get("last_balance")
+    }
+
 class WalletDisplay(Static):
     """Display wallet information with balance."""
     
@@ -58,11 +189,16 @@ class WalletDisplay(Static):
             f"[bold blue]Wallet Address:[/] {wallet_data['classic_address']}\n"
             f"[bold blue]Explorer:[/] https://testnet.xrpl.org/accounts/{wallet_data['classic_address']}"
         )
-        self.query_one("#balance-info").update("[yellow]Fetching balance...[/]")
+        if wallet_data.get("last_balance") is not None:
+            # Show the last known balance right away; get_balance refreshes it
+            self.update_balance(wallet_data["last_balance"], cached=True)
+        else:
+            self.query_one("#balance-info").update("[yellow]Fetching balance...[/]")
 
-    def update_balance(self, balance: float):
+    def update_balance(self, balance: float, cached: bool = False):
         """Update balance display."""
-        self.query_one("#balance-info").update(f"[bold green]Balance:[/] {balance} XRP")
+        suffix = " [dim](cached)[/]" if cached else ""
+        self.query_one("#balance-info").update(f"[bold green]Balance:[/] {balance} XRP{suffix}")
 
 class ResultDisplay(Static):
     """Display operation results."""
@@ -117,7 +253,40 @@ class NFTApp(App):
         super().__init__()
         # Create wallets directory if it doesn't exist
         os.makedirs(WALLETS_DIR, exist_ok=True)
+        self._index_path = os.path.join(WALLETS_DIR, "_index.json")
+        self._index_lock = threading.Lock()
+        # Wallet list served to the screens, dropped whenever the index changes
+        self._wallets_cache = None
+        # Derived signing keys per address, so mint/transfer skip key derivation
+        self._wallet_cache = {}
+        # Last /nfts ETag and rendered list per address, for conditional GETs
+        self._nfts_etag = {}
+        self._nfts_cache = {}
+        # Next account sequence per address, so back-to-back transactions skip AccountInfo
+        self._seq_cache = {}
+        self._seq_lock = threading.Lock()
+        self._uri_pool = deque(_make_uris(_URI_POOL_SIZE))
+        self._uri_refilling = False
         self.wallet_data = self.load_current_wallet()
+        # One persistent websocket shared by every worker, opened on first use
+        self.xrpl_client = WebsocketClient(XRPL_TESTNET_WS_URL)
+        self._xrpl_lock = threading.Lock()
+        self._xrpl_last_used = time.monotonic()
+        # Shared pool for blocking I/O: per-wallet lookups and backend fetches from the screens
+        self._pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix="rwa-io")
+        # Small pool for signing, so CPU-bound crypto never runs on the event loop
+        self._crypto_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="crypto")
+        # Keep-alive session for the backend (http://) and faucet (https://)
+        self.http = requests.Session()
+        self.http.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+        self.http.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+        # Async client for the async workers (view_nfts, generate_wallet, transfer_nft).
+        # HTTP/2 is negotiated over TLS (the faucet); the plain-http backend stays on HTTP/1.1
+        self.ahttp = httpx.AsyncClient(
+            http2=True,
+            timeout=httpx.Timeout(HTTP_TIMEOUT[1], connect=HTTP_TIMEOUT[0]),
+            limits=httpx.Limits(max_connections=8)
+        )
 
     def compose(self) -> ComposeResult:
         """Create child widgets for the app."""
@@ -140,111 +309,242 @@ class NFTApp(App):
 
     def on_mount(self) -> None:
         """Refresh wallet info when app starts."""
+        # Cache the main screen widgets that worker callbacks update
+        self._result_display = self.query_one("#result-display", ResultDisplay)
+        self._wallet_display = self.query_one("#wallet-display", WalletDisplay)
+        self.set_interval(XRPL_WS_IDLE_TIMEOUT / 4, self._check_xrpl_idle)
         self.refresh_display()
 
+    async def on_unmount(self) -> None:
+        """Release worker threads and HTTP connections on exit."""
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        self._crypto_pool.shutdown(wait=False, cancel_futures=True)
+        with self._xrpl_lock:
+            self.xrpl_client.close()
+        self.http.close()
+        await self.ahttp.aclose()
+
     def refresh_display(self):
         """Refresh all display elements."""
-        try:
-            wallet_display = self.query_one("#wallet-display")
-            if wallet_display:
-                wallet_display.update_info(self.wallet_data)
-                if self.wallet_data:
-                    self.get_balance()
-        except Exception as e:
-            logger.error(f"Error refreshing display: {str(e)}")
+        self._wallet_display.update_info(self.wallet_data)
+        if self.wallet_data:
+            self.get_balance()
 
-    @work(thread=True)
-    def get_balance(self):
-        """Get wallet balance in a separate thread."""
+    @work
+    async def get_balance(self):
+        """Get wallet balance without blocking the event loop."""
+        wallet_data = self.wallet_data
         try:
-            # Create a new client for each request
-            client = JsonRpcClient(XRPL_TESTNET_URL)
-            
             # Create proper XRPL request model
             request = AccountInfo(
-                account=self.wallet_data["classic_address"],
+                account=wallet_data["classic_address"],
                 ledger_index="validated",
                 strict=True
             )
-            logger.info(f"Creating balance request for {self.wallet_data['classic_address']}")
+            logger.info("Creating balance request for %s", wallet_data['classic_address'])
             try:
-                response = client.request(request)
-                logger.info(f"Raw response: {json.dumps(response.result, indent=2)}")
+                # The shared websocket client is blocking; wait for it on a thread
+                response = await asyncio.to_thread(self._xrpl_request, request)
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info("Raw response: %s", orjson.dumps(response.result).decode())
             except Exception as req_error:
-                logger.error(f"Request failed: {str(req_error)}")
+                logger.error("Request failed: %s", req_error)
                 raise
             
             if response.is_successful():
                 balance = int(response.result["account_data"]["Balance"])
                 balance_xrp = balance / 1_000_000
-                logger.info(f"Balance fetched: {balance_xrp} XRP")
-                def update_ui():
-                    try:
-                        wallet_display = self.query_one("#wallet-display", WalletDisplay)
-                        if wallet_display:
-                            wallet_display.update_balance(balance_xrp)
-                    except Exception as ui_error:
-                        logger.error(f"Error updating wallet display: {str(ui_error)}")
-                
-                self.call_from_thread(update_ui)
+                logger.info("Balance fetched: %s XRP", balance_xrp)
+                await asyncio.to_thread(self.cache_balance, wallet_data, balance_xrp)
+                self._wallet_display.update_balance(balance_xrp)
             else:
-                logger.error(f"Failed to get balance. Response: {json.dumps(response.result, indent=2)}")
-                def show_error():
-                    try:
-                        wallet_display = self.query_one("#wallet-display", WalletDisplay)
-                        if wallet_display:
-                            wallet_display.update_balance(0)
-                    except Exception as ui_error:
-                        logger.error(f"Error updating wallet display: {str(ui_error)}")
-                
-                self.call_from_thread(show_error)
+                if logger.isEnabledFor(logging.ERROR):
+                    logger.error("Failed to get balance. Response: %s", orjson.dumps(response.result).decode())
+                self._wallet_display.update_balance(0)
         except Exception as e:
-            logger.error(f"Error getting balance: {str(e)}")
-            def show_error():
-                try:
-                    wallet_display = self.query_one("#wallet-display", WalletDisplay)
-                    if wallet_display:
-                        wallet_display.update_balance(0)
-                except Exception as ui_error:
-                    logger.error(f"Error updating wallet display: {str(ui_error)}")
-            
-            self.call_from_thread(show_error)
+            logger.error("Error getting balance: %s", e)
+            self._wallet_display.update_balance(0)
+
+    def _xrpl_request(self, request):
+        """Send a request over the shared XRPL websocket, (re)opening it if needed."""
+        with self._xrpl_lock:
+            if not self.xrpl_client.is_open():
+                self.xrpl_client.open()
+            self._xrpl_last_used = time.monotonic()
+        return self.xrpl_client.request(request)
+
+    def _check_xrpl_idle(self) -> None:
+        """Close the websocket once idle; the next request reopens a fresh one."""
+        if self.xrpl_client.is_open() and time.monotonic() - self._xrpl_last_used > XRPL_WS_IDLE_TIMEOUT:
+            self.run_worker(self._close_idle_xrpl, thread=True)
+
+    def _close_idle_xrpl(self) -> None:
+        """Close the websocket unless a request used it since the idle check."""
+        with self._xrpl_lock:
+            if time.monotonic() - self._xrpl_last_used > XRPL_WS_IDLE_TIMEOUT:
+                self.xrpl_client.close()
+                logger.info("Closed idle XRPL websocket")
+
+    def _next_sequence(self, address: str, count: int = 1) -> int:
+        """Reserve count consecutive account sequences and return the first.
+        
+        The sequence is fetched from the ledger on a cache miss.
+        """
+        with self._seq_lock:
+            sequence = self._seq_cache.get(address)
+            if sequence is None:
+                response = self._xrpl_request(AccountInfo(
+                    account=address,
+                    ledger_index="current",
+                    strict=True
+                ))
+                if not response.is_successful():
+                    raise Exception("Failed to get account sequence")
+                sequence = response.result["account_data"]["Sequence"]
+            self._seq_cache[address] = sequence + count
+            return sequence
+
+    def _reset_sequence(self, address: str):
+        """Forget the cached sequence so the next transaction re-syncs with the ledger."""
+        with self._seq_lock:
+            self._seq_cache.pop(address, None)
+
+    def _check_sequence_result(self, address: str, result: dict):
+        """Reset the cached sequence unless the submission consumed it.
+        
+        /submit only answers with a status, so that is the signal the cache
+        follows; an engine result is checked as well when one is present.
+        """
+        engine_result = result.get("engine_result")
+        consumed = engine_result is None or engine_result.startswith(_SEQUENCE_CONSUMED)
+        if result.get("status") != "success" or not consumed:
+            logger.warning("Submission from %s not accepted, refetching sequence on next transaction", address)
+            self._reset_sequence(address)
+
+    def _fetch_balance(self, address: str):
+        """Return the XRP balance of an account, or None if it cannot be read."""
+        response = self._xrpl_request(AccountInfo(
+            account=address,
+            ledger_index="validated",
+            strict=True
+        ))
+        if not response.is_successful():
+            return None
+        return int(response.result["account_data"]["Balance"]) / 1_000_000
+
+    @work(thread=True)
+    def prefetch_balances(self, addresses, callback):
+        """Fetch balances for several wallets concurrently and hand them to callback on the UI thread."""
+        futures = {self._pool.submit(self._fetch_balance, address): address for address in addresses}
+        results = {}
+        for future in as_completed(futures):
+            address = futures[future]
+            try:
+                results[address] = future.result()
+            except Exception as e:
+                logger.error("Error prefetching balance for %s: %s", address, e)
+                results[address] = None
+        self.call_from_thread(callback, results)
+
+    def cache_balance(self, wallet_data: dict, balance: float):
+        """Persist the last fetched balance in the wallet file."""
+        if wallet_data.get("last_balance") == balance:
+            return
+        try:
+            wallet_data = {
+                **wallet_data,
+                "last_balance": balance,
+                "last_balance_ts": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds")
+            }
+            wallet_file = os.path.join(WALLETS_DIR, f"{wallet_data['classic_address']}.json")
+            _write_json_atomic(wallet_file, wallet_data)
+            self._update_index(wallet_data["classic_address"], wallet_data)
+            if self.wallet_data and self.wallet_data["classic_address"] == wallet_data["classic_address"]:
+                self.wallet_data = wallet_data
+        except Exception as e:
+            logger.error("Error caching balance: %s", e)
+
+    def _get_wallet(self, seed: str, address: str) -> Wallet:
+        """Return the signing wallet for address, deriving it from the seed only once."""
+        wallet = self._wallet_cache.get(address)
+        if wallet is None:
+            wallet = self._wallet_cache[address] = Wallet.from_seed(seed)
+        return wallet
+
+    def _post_json(self, url: str, data: dict):
+        """POST a JSON body to the backend, gzip-compressing it when large."""
+        body, headers = _encode_json_body(data)
+        return self.http.post(url, data=body, headers=headers, timeout=HTTP_TIMEOUT)
+
+    async def _apost_json(self, url: str, data: dict):
+        """Async counterpart of _post_json, sent over the shared httpx client."""
+        body, headers = _encode_json_body(data)
+        return await self.ahttp.post(url, content=body, headers=headers)
+
+    async def fetch(self, url: str):
+        """GET url over the pooled session, awaiting it on the shared I/O pool."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._pool, lambda: self.http.get(url, timeout=HTTP_TIMEOUT))
 
     def load_current_wallet(self):
         """Load the currently selected wallet."""
         try:
             if os.path.exists(CURRENT_WALLET_FILE):
-                with open(CURRENT_WALLET_FILE, "r") as f:
-                    current = json.load(f)
+                with open(CURRENT_WALLET_FILE, "rb") as f:
+                    current = orjson.loads(f.read())
                     wallet_file = os.path.join(WALLETS_DIR, f"{current['address']}.json")
                     if os.path.exists(wallet_file):
-                        with open(wallet_file, "r") as wf:
-                            return json.load(wf)
+                        with open(wallet_file, "rb") as wf:
+                            return orjson.loads(wf.read())
             return None
         except Exception as e:
-            logger.error(f"Error loading current wallet: {str(e)}")
+            logger.error("Error loading current wallet: %s", e)
             return None
 
     def save_current_wallet(self, address: str):
         """Save the current wallet selection."""
+        _write_json_atomic(CURRENT_WALLET_FILE, {"address": address})
+
+    def _scan_wallets(self):
+        """Build the wallet index by reading every wallet file."""
+        index = {}
+        for filename in os.listdir(WALLETS_DIR):
+            if filename.endswith(".json") and not filename.startswith("_"):
+                with open(os.path.join(WALLETS_DIR, filename), "rb") as f:
+                    wallet = orjson.loads(f.read())
+                index[wallet["classic_address"]] = _index_entry(wallet)
+        return index
+
+    def _load_index(self):
+        """Load the wallet index, rebuilding it from the wallet files if missing."""
         try:
-            with open(CURRENT_WALLET_FILE, "w") as f:
-                json.dump({"address": address}, f)
-        except Exception as e:
-            logger.error(f"Error saving current wallet selection: {str(e)}")
+            with open(self._index_path, "rb") as f:
+                return orjson.loads(f.read())
+        except FileNotFoundError:
+            index = self._scan_wallets()
+            _write_json_atomic(self._index_path, index)
+            return index
+
+    def _update_index(self, address: str, wallet_data=None):
+        """Refresh one wallet's index entry, or drop it when wallet_data is None."""
+        with self._index_lock:
+            index = self._load_index()
+            if wallet_data is None:
+                index.pop(address, None)
+            else:
+                index[address] = _index_entry(wallet_data)
+            _write_json_atomic(self._index_path, index)
+            self._wallets_cache = None
 
     def load_all_wallets(self):
         """Load all available wallets."""
-        wallets = []
         try:
-            for filename in os.listdir(WALLETS_DIR):
-                if filename.endswith(".json"):
-                    with open(os.path.join(WALLETS_DIR, filename), "r") as f:
-                        wallet = json.load(f)
-                        wallets.append(wallet)
-            return wallets
+            with self._index_lock:
+                if self._wallets_cache is None:
+                    self._wallets_cache = list(self._load_index().values())
+                return list(self._wallets_cache)
         except Exception as e:
-            logger.error(f"Error loading wallets: {str(e)}")
+            logger.error("Error loading wallets: %s", e)
             return []
 
     def save_wallet(self, wallet):
@@ -255,8 +555,8 @@ class NFTApp(App):
                 "seed": wallet.seed
             }
             wallet_file = os.path.join(WALLETS_DIR, f"{wallet.classic_address}.json")
-            with open(wallet_file, "w") as f:
-                json.dump(wallet_data, f)
+            _write_json_atomic(wallet_file, wallet_data)
+            self._update_index(wallet.classic_address, wallet_data)
             
             # If this is the first wallet, make it the current wallet
             if not self.wallet_data:
@@ -265,7 +565,7 @@ class NFTApp(App):
             
             return wallet_data
         except Exception as e:
-            logger.error(f"Error saving wallet: {str(e)}")
+            logger.error("Error saving wallet: %s", e)
             return None
 
     @work(thread=True)
@@ -276,33 +576,21 @@ class NFTApp(App):
             if not os.path.exists(wallet_file):
                 raise Exception("Wallet not found")
             
-            with open(wallet_file, "r") as f:
-                self.wallet_data = json.load(f)
+            with open(wallet_file, "rb") as f:
+                self.wallet_data = orjson.loads(f.read())
+            self._wallet_cache.clear()
             self.save_current_wallet(address)
             
             # Update UI safely from the thread
             def update_ui():
-                try:
-                    self.refresh_display()
-                    result_display = self.query_one("#result-display", ResultDisplay)
-                    if result_display:
-                        result_display.update("[green]Wallet switched successfully![/]")
-                except Exception as ui_error:
-                    logger.error(f"Error updating UI after wallet switch: {str(ui_error)}")
+                self.refresh_display()
+                self._result_display.update("[green]Wallet switched successfully![/]")
             
             self.call_from_thread(update_ui)
             
         except Exception as e:
-            logger.error(f"Error switching wallet: {str(e)}")
-            def show_error():
-                try:
-                    result_display = self.query_one("#result-display", ResultDisplay)
-                    if result_display:
-                        result_display.update(f"[red]Error switching wallet: {str(e)}[/]")
-                except Exception as ui_error:
-                    logger.error(f"Error showing error message: {str(ui_error)}")
-            
-            self.call_from_thread(show_error)
+            logger.error("Error switching wallet: %s", e)
+            self.call_from_thread(self._result_display.update, f"[red]Error switching wallet: {str(e)}[/]")
 
     @work(thread=True)
     def remove_wallet(self, address: str):
@@ -319,30 +607,19 @@ class NFTApp(App):
                     os.remove(CURRENT_WALLET_FILE)
             
             os.remove(wallet_file)
+            self._wallet_cache.pop(address, None)
+            self._update_index(address)
             
             # Update UI safely from the thread
             def update_ui():
-                try:
-                    self.refresh_display()
-                    result_display = self.query_one("#result-display", ResultDisplay)
-                    if result_display:
-                        result_display.update("[green]Wallet removed successfully![/]")
-                except Exception as ui_error:
-                    logger.error(f"Error updating UI after wallet removal: {str(ui_error)}")
+                self.refresh_display()
+                self._result_display.update("[green]Wallet removed successfully![/]")
             
             self.call_from_thread(update_ui)
             
         except Exception as e:
-            logger.error(f"Error removing wallet: {str(e)}")
-            def show_error():
-                try:
-                    result_display = self.query_one("#result-display", ResultDisplay)
-                    if result_display:
-                        result_display.update(f"[red]Error removing wallet: {str(e)}[/]")
-                except Exception as ui_error:
-                    logger.error(f"Error showing error message: {str(ui_error)}")
-            
-            self.call_from_thread(show_error)
+            logger.error("Error removing wallet: %s", e)
+            self.call_from_thread(self._result_display.update, f"[red]Error removing wallet: {str(e)}[/]")
 
     @work(thread=True)
     def import_wallet(self, seed: str):
@@ -354,27 +631,14 @@ class NFTApp(App):
             
             # Update UI safely from the thread
             def update_ui():
-                try:
-                    self.refresh_display()
-                    result_display = self.query_one("#result-display", ResultDisplay)
-                    if result_display:
-                        result_display.update(f"[green]Wallet imported successfully![/]\nAddress: {wallet.classic_address}")
-                except Exception as ui_error:
-                    logger.error(f"Error updating UI after wallet import: {str(ui_error)}")
+                self.refresh_display()
+                self._result_display.update(f"[green]Wallet imported successfully![/]\nAddress: {wallet.classic_address}")
             
             self.call_from_thread(update_ui)
             
         except Exception as e:
-            logger.error(f"Error importing wallet: {str(e)}")
-            def show_error():
-                try:
-                    result_display = self.query_one("#result-display", ResultDisplay)
-                    if result_display:
-                        result_display.update(f"[red]Error importing wallet: {str(e)}[/]")
-                except Exception as ui_error:
-                    logger.error(f"Error showing error message: {str(ui_error)}")
-            
-            self.call_from_thread(show_error)
+            logger.error("Error importing wallet: %s", e)
+            self.call_from_thread(self._result_display.update, f"[red]Error importing wallet: {str(e)}[/]")
             raise
 
     def action_switch(self):
@@ -395,46 +659,32 @@ class NFTApp(App):
         if self.wallet_data:
             self.push_screen(MintScreen())
         else:
-            try:
-                result_display = self.query_one("#result-display", ResultDisplay)
-                if result_display:
-                    result_display.update("[red]No wallet found. Generate one first.[/]")
-            except Exception as e:
-                logger.debug(f"No result display found when showing mint error: {str(e)}")
+            self._result_display.update("[red]No wallet found. Generate one first.[/]")
 
     def action_view(self):
         """View NFTs."""
         if self.wallet_data:
             self.view_nfts()
         else:
-            try:
-                result_display = self.query_one("#result-display", ResultDisplay)
-                if result_display:
-                    result_display.update("[red]No wallet found. Generate one first.[/]")
-            except Exception as e:
-                logger.debug(f"No result display found when showing view error: {str(e)}")
+            self._result_display.update("[red]No wallet found. Generate one first.[/]")
 
     def action_transfer(self):
         """Show the transfer NFT form screen."""
         if self.wallet_data:
             self.push_screen(TransferScreen())
         else:
-            try:
-                result_display = self.query_one("#result-display", ResultDisplay)
-                if result_display:
-                    result_display.update("[red]No wallet found. Generate one first.[/]")
-            except Exception as e:
-                logger.debug(f"No result display found when showing transfer error: {str(e)}")
+            self._result_display.update("[red]No wallet found. Generate one first.[/]")
 
     def action_back(self):
         """Return to base menu."""
         self.refresh_display()
-        try:
-            result_display = self.query_one("#result-display", ResultDisplay)
-            if result_display:
-                result_display.update("")
-        except Exception as e:
-            logger.debug(f"No result display found when going back: {str(e)}")
+        self._result_display.update("")
+
+    def pop_to_root(self):
+        """Pop every pushed screen back to the main one in a single update."""
+        with self.batch_update():
+            while len(self.screen_stack) > 1:
+                self.pop_screen()
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button presses."""
@@ -453,253 +703,189 @@ class NFTApp(App):
         elif event.button.id == "back":
             self.action_back()
 
-    @work(thread=True)
-    def generate_wallet(self):
+    @work
+    async def generate_wallet(self):
         """Generate and fund a new wallet."""
         try:
-            def show_creating():
-                try:
-                    result_display = self.query_one("#result-display", ResultDisplay)
-                    if result_display:
-                        result_display.update("[yellow]Creating new wallet...[/]")
-                except Exception as ui_error:
-                    logger.error(f"Error showing creating message: {str(ui_error)}")
-            
-            self.call_from_thread(show_creating)
-            
-            wallet = Wallet.create()
-            response = requests.post(
-                "https://faucet.altnet.rippletest.net/accounts",
+            self._result_display.update("[yellow]Creating new wallet...[/]")
+            loop = asyncio.get_running_loop()
+            
+            # Key generation is CPU-bound; keep it off the event loop like signing
+            wallet = await loop.run_in_executor(self._crypto_pool, Wallet.create)
+            response = await self.ahttp.post(
+                FAUCET_URL,
                 json={"destination": wallet.classic_address}
             )
             
             if response.status_code != 200:
                 raise Exception("Failed to fund wallet from faucet")
             
-            self.wallet_data = self.save_wallet(wallet)
-            logger.info(f"Wallet generated: {wallet.classic_address}")
+            # File writes and the index lock stay off the event loop
+            self.wallet_data = await asyncio.to_thread(self.save_wallet, wallet)
+            logger.info("Wallet generated: %s", wallet.classic_address)
             
-            def update_ui():
-                try:
-                    self.refresh_display()
-                    result_display = self.query_one("#result-display", ResultDisplay)
-                    if result_display:
-                        result_display.update(
-                            f"[green]Wallet created successfully![/]\nAddress: {wallet.classic_address}\nSeed: {wallet.seed}"
-                        )
-                except Exception as ui_error:
-                    logger.error(f"Error updating UI after wallet generation: {str(ui_error)}")
-            
-            self.call_from_thread(update_ui)
+            self.refresh_display()
+            self._result_display.update(
+                f"[green]Wallet created successfully![/]\nAddress: {wallet.classic_address}\nSeed: {wallet.seed}"
+            )
             
         except Exception as e:
-            logger.error(f"Error generating wallet: {str(e)}")
-            def show_error():
-                try:
-                    result_display = self.query_one("#result-display", ResultDisplay)
-                    if result_display:
-                        result_display.update(f"[red]Failed to create wallet: {str(e)}[/]")
-                except Exception as ui_error:
-                    logger.error(f"Error showing error message: {str(ui_error)}")
-            
-            self.call_from_thread(show_error)
+            logger.error("Error generating wallet: %s", e)
+            self._result_display.update(f"[red]Failed to create wallet: {str(e)}[/]")
 
     @work(thread=True)
     def mint_nft(self, wallet, uri, metadata=None):
         """Mint an NFT."""
         try:
-            def show_preparing():
-                try:
-                    result_display = self.query_one("#result-display", ResultDisplay)
-                    if result_display:
-                        result_display.update("[yellow]Preparing to mint NFT...[/]")
-                except Exception as ui_error:
-                    logger.error(f"Error showing preparing message: {str(ui_error)}")
-            
-            self.call_from_thread(show_preparing)
-            
-            # Get current sequence number
-            client = JsonRpcClient(XRPL_TESTNET_URL)
-            seq_request = AccountInfo(
-                account=wallet["classic_address"],
-                ledger_index="validated",
-                strict=True
-            )
-            seq_response = client.request(seq_request)
-            if not seq_response.is_successful():
-                raise Exception("Failed to get account sequence")
+            self.call_from_thread(self._result_display.update, "[yellow]Preparing to mint NFT...[/]")
             
-            current_sequence = seq_response.result["account_data"]["Sequence"]
-            logger.info(f"Got sequence number: {current_sequence}")
+            current_sequence = self._next_sequence(wallet["classic_address"])
+            logger.info("Using sequence number: %s", current_sequence)
             
-            # Get template
-            template_data = {
-                "account": wallet["classic_address"],
-                "uri": uri,
-                "flags": 8,
-                "transfer_fee": 0,
-                "taxon": 0,
-                "metadata": metadata or {
-                    "source": "RWA CLI",
-                    "version": "1.0"
-                }
+            metadata = metadata or {
+                "source": "RWA CLI",
+                "version": "1.0"
             }
             
-            template_response = requests.post(
-                f"{BACKEND_BASE_URL}{MINT_TEMPLATE_ROUTE}",
-                json=template_data
-            )
-            
-            if template_response.status_code != 200:
-                raise Exception(f"Failed to get template: {template_response.json().get('error')}")
-            
-            template = template_response.json()["template"]["template"]
-            
-            # Create and sign transaction
+            # Build and sign the transaction locally; it matches the backend's mint template
             mint_tx = NFTokenMint(
-                account=template["account"],
-                uri=template["uri"],
-                flags=template["flags"],
-                transfer_fee=template["transfer_fee"],
-                nftoken_taxon=template["nftoken_taxon"],
+                account=wallet["classic_address"],
+                uri=str_to_hex(uri),
+                flags=8,
+                transfer_fee=0,
+                nftoken_taxon=0,
                 sequence=current_sequence,
                 fee="10"  # Standard fee in drops
             )
             
-            wallet_instance = Wallet.from_seed(wallet["seed"])
+            wallet_instance = self._get_wallet(wallet["seed"], wallet["classic_address"])
             signed_tx = sign(mint_tx, wallet_instance)
-            tx_blob = binarycodec.encode(signed_tx.to_xrpl())
+            tx_blob = signed_tx.blob()
             
             # Submit transaction
             submit_data = {
                 "signed_transaction": {
                     "tx_blob": tx_blob,
-                    "hash": signed_tx.get_hash(),
+                    "hash": _tx_hash(tx_blob),
                     "sequence": current_sequence,
                     "account": wallet["classic_address"]
                 },
                 "account": wallet["classic_address"],
                 "uri": uri,
-                "metadata": template_data["metadata"]
+                "metadata": metadata
             }
             
-            logger.info(f"Submitting transaction with sequence {current_sequence}")
-            submit_response = requests.post(
-                f"{BACKEND_BASE_URL}{SUBMIT_TRANSACTION_ROUTE}",
-                json=submit_data
+            logger.info("Submitting transaction with sequence %s", current_sequence)
+            submit_response = self._post_json(
+                CFG.submit_url,
+                submit_data
             )
             
             if submit_response.status_code != 200:
-                error_msg = submit_response.json().get('error', '')
+                error_msg = orjson.loads(submit_response.content).get('error', '')
                 if "duplicate key error" in error_msg:
                     logger.warning("NFT minted successfully but failed to track in database")
-                    def show_success_warning():
-                        try:
-                            result_display = self.query_one("#result-display", ResultDisplay)
-                            if result_display:
-                                result_display.update(
-                                    "[green]NFT minted successfully on XRPL![/]\n[yellow]Warning: Failed to track NFT in backend database[/]"
-                                )
-                        except Exception as ui_error:
-                            logger.error(f"Error showing success warning: {str(ui_error)}")
-                    
-                    self.call_from_thread(show_success_warning)
+                    self.call_from_thread(
+                        self._result_display.update,
+                        "[green]NFT minted successfully on XRPL![/]\n[yellow]Warning: Failed to track NFT in backend database[/]"
+                    )
                     return
                 raise Exception(f"Failed to submit: {error_msg}")
             
-            result = submit_response.json()
-            def show_success():
-                try:
-                    result_display = self.query_one("#result-display", ResultDisplay)
-                    if result_display:
-                        result_display.update(f"[green]NFT minted successfully![/]\n{Pretty(result)}")
-                except Exception as ui_error:
-                    logger.error(f"Error showing success message: {str(ui_error)}")
-            
-            self.call_from_thread(show_success)
+            result = orjson.loads(submit_response.content)
+            self._check_sequence_result(wallet["classic_address"], result)
+            self.call_from_thread(self._result_display.update, f"[green]NFT minted successfully![/]\n{_render_result(result)}")
             
         except Exception as e:
-            logger.error(f"Error minting NFT: {str(e)}")
-            def show_error():
-                try:
-                    result_display = self.query_one("#result-display", ResultDisplay)
-                    if result_display:
-                        result_display.update(f"[red]Error minting NFT: {str(e)}[/]")
-                except Exception as ui_error:
-                    logger.error(f"Error showing error message: {str(ui_error)}")
-            
-            self.call_from_thread(show_error)
+            logger.error("Error minting NFT: %s", e)
+            self._reset_sequence(wallet["classic_address"])
+            self.call_from_thread(self._result_display.update, f"[red]Error minting NFT: {str(e)}[/]")
 
-    @work(thread=True)
-    def view_nfts(self):
+    @work
+    async def view_nfts(self):
         """View NFTs for current wallet."""
         try:
-            def show_fetching():
-                try:
-                    result_display = self.query_one("#result-display", ResultDisplay)
-                    if result_display:
-                        result_display.update("[yellow]Fetching NFTs...[/]")
-                except Exception as ui_error:
-                    logger.error(f"Error showing fetching message: {str(ui_error)}")
-            
-            self.call_from_thread(show_fetching)
-            
-            response = requests.get(
-                f"{BACKEND_BASE_URL}{NFT_VIEW_ROUTE.format(address=self.wallet_data['classic_address'])}"
-            )
-            
-            if response.status_code != 200:
-                raise Exception(f"Failed to fetch NFTs: {response.json().get('error')}")
-            
-            nfts_data = response.json()
-            nfts = nfts_data.get('nfts', [])
-            
-            if not nfts:
-                def show_no_nfts():
-                    try:
-                        result_display = self.query_one("#result-display", ResultDisplay)
-                        if result_display:
-                            result_display.update("[yellow]No NFTs found for this wallet[/]")
-                    except Exception as ui_error:
-                        logger.error(f"Error showing no NFTs message: {str(ui_error)}")
+            self._result_display.update("[yellow]Fetching NFTs...[/]")
+            
+            address = self.wallet_data['classic_address']
+            url = CFG.nft_view_url.format(address=address)
+            headers = {"If-None-Match": self._nfts_etag[address]} if address in self._nfts_etag else {}
+            nft_text = Text.from_markup(_NFTS_HEADER)
+            parts = []
+            count = 0
+            async with self.ahttp.stream("GET", url, headers=headers) as response:
+                if response.status_code == 304:
+                    # Unchanged since the last fetch: reuse the rendered list
+                    nft_display = self._nfts_cache[address]
+                    if nft_display is None:
+                        self._result_display.update("[yellow]No NFTs found for this wallet[/]")
+                    else:
+                        self._result_display.update(nft_display)
+                    return
+                if response.status_code != 200:
+                    await response.aread()
+                    raise Exception(f"Failed to fetch NFTs: {response.json().get('error')}")
                 
-                self.call_from_thread(show_no_nfts)
+                # Parse the NFT list as it arrives and render it in steps
+                events = ijson.sendable_list()
+                parser = ijson.items_coro(events, "nfts.item")
+                async for chunk in response.aiter_bytes():
+                    parser.send(chunk)
+                    for nft in events:
+                        count += 1
+                        parts.append(_NFT_TMPL.format_map({
+                            "i": count,
+                            "uri": nft.get('uri', 'N/A'),
+                            "transaction_hash": nft.get('transaction_hash', 'N/A'),
+                            "status": nft.get('status', 'N/A')
+                        }))
+                        if nft.get('metadata'):
+                            parts.append("Metadata:\n")
+                            parts.extend(_NFT_METADATA_LINE.format(key, value) for key, value in nft['metadata'].items())
+                        parts.append("\n")
+                        if count % _NFT_RENDER_BATCH == 0:
+                            # Parse only the new batch and append it to what is already rendered
+                            nft_text.append_text(Text.from_markup("".join(parts)))
+                            parts.clear()
+                            self._result_display.update(nft_text)
+                    del events[:]
+                parser.close()
+            
+            nft_text.append_text(Text.from_markup("".join(parts)))
+            nft_display = nft_text if count else None
+            etag = response.headers.get("ETag")
+            if etag:
+                self._nfts_etag[address] = etag
+                self._nfts_cache[address] = nft_display
+            
+            if nft_display is None:
+                self._result_display.update("[yellow]No NFTs found for this wallet[/]")
                 return
             
-            # Format NFTs into a readable display
-            nft_display = "[bold blue]Your NFTs:[/]\n\n"
-            for i, nft in enumerate(nfts, 1):
-                nft_display += f"[bold green]NFT #{i}[/]\n"
-                nft_display += f"URI: {nft.get('uri', 'N/A')}\n"
-                nft_display += f"Transaction Hash: {nft.get('transaction_hash', 'N/A')}\n"
-                nft_display += f"Status: {nft.get('status', 'N/A')}\n"
-                if nft.get('metadata'):
-                    nft_display += "Metadata:\n"
-                    for key, value in nft['metadata'].items():
-                        nft_display += f"  {key}: {value}\n"
-                nft_display += "\n"
-            
-            def show_nfts():
-                try:
-                    result_display = self.query_one("#result-display", ResultDisplay)
-                    if result_display:
-                        result_display.update(Text.from_markup(nft_display))
-                except Exception as ui_error:
-                    logger.error(f"Error showing NFTs: {str(ui_error)}")
-            
-            self.call_from_thread(show_nfts)
+            self._result_display.update(nft_display)
             
         except Exception as e:
-            logger.error(f"Error viewing NFTs: {str(e)}")
-            def show_error():
-                try:
-                    result_display = self.query_one("#result-display", ResultDisplay)
-                    if result_display:
-                        result_display.update(f"[red]Error viewing NFTs: {str(e)}[/]")
-                except Exception as ui_error:
-                    logger.error(f"Error showing error message: {str(ui_error)}")
-            
-            self.call_from_thread(show_error)
+            logger.error("Error viewing NFTs: %s", e)
+            self._result_display.update(f"[red]Error viewing NFTs: {str(e)}[/]")
+
+    def _next_uri(self) -> str:
+        """Take a pre-generated mint URI, topping the pool up when it runs low."""
+        try:
+            uri = self._uri_pool.popleft()
+        except IndexError:
+            uri = _make_uris(1)[0]
+        if len(self._uri_pool) < _URI_POOL_LOW and not self._uri_refilling:
+            self._uri_refilling = True
+            self._refill_uris()
+        return uri
+
+    @work(thread=True)
+    def _refill_uris(self):
+        """Top the URI pool back up to its full size."""
+        try:
+            self._uri_pool.extend(_make_uris(_URI_POOL_SIZE - len(self._uri_pool)))
+        finally:
+            self._uri_refilling = False
 
     def mint_nft_with_metadata(self, metadata: dict):
         """Mint an NFT with the provided metadata."""
@@ -707,99 +893,101 @@ class NFTApp(App):
             return
         
         # Generate IPFS-style URI with metadata
-        uri = f"ipfs://QmRWA{uuid.uuid4().hex}"  # Placeholder URI, should be real IPFS in production
+        uri = self._next_uri()  # Placeholder URI, should be real IPFS in production
         
         # Start the minting process with metadata
         self.mint_nft(self.wallet_data, uri, metadata)
 
+    def _build_offer_tx(self, nft_id: str, destination: str, sequence: int) -> dict:
+        """Build and sign a zero-amount sell offer that transfers nft_id to destination."""
+        account = self.wallet_data["classic_address"]
+        return _sign_offer(
+            account, self._get_wallet(self.wallet_data["seed"], account), nft_id, destination, sequence
+        )
+
     @work(thread=True)
-    def transfer_nft(self, nft_id: str, destination: str):
-        """Transfer an NFT to another address."""
+    def transfer_nfts_batch(self, pairs):
+        """Transfer several NFTs in one backend request.
+        
+        pairs is a list of (nft_id, destination) tuples. Offers are signed
+        with consecutive sequence numbers from a single sequence lookup.
+        """
+        address = self.wallet_data["classic_address"]
         try:
-            def show_preparing():
-                try:
-                    result_display = self.query_one("#result-display", ResultDisplay)
-                    if result_display:
-                        result_display.update("[yellow]Preparing NFT transfer...[/]")
-                except Exception as ui_error:
-                    logger.error(f"Error showing preparing message: {str(ui_error)}")
-            
-            self.call_from_thread(show_preparing)
-            
-            # Get current sequence number
-            client = JsonRpcClient(XRPL_TESTNET_URL)
-            seq_request = AccountInfo(
-                account=self.wallet_data["classic_address"],
-                ledger_index="validated",
-                strict=True
-            )
-            seq_response = client.request(seq_request)
-            if not seq_response.is_successful():
-                raise Exception("Failed to get account sequence")
-            
-            current_sequence = seq_response.result["account_data"]["Sequence"]
-            logger.info(f"Got sequence number: {current_sequence}")
-            
-            # Create NFT offer transaction
-            offer_tx = NFTokenCreateOffer(
-                account=self.wallet_data["classic_address"],
-                nftoken_id=nft_id,
-                destination=destination,
-                amount="0",  # 0 for a transfer (not a sale)
-                flags=1,  # tfSellNFToken flag
-                sequence=current_sequence,
-                fee="10"  # Standard fee in drops
+            self.call_from_thread(self._result_display.update, f"[yellow]Preparing {len(pairs)} NFT transfers...[/]")
+            
+            for nft_id, destination in pairs:
+                _check_transfer_input(nft_id, destination, address)
+            first_sequence = self._next_sequence(address, len(pairs))
+            # Resolve the signing wallet and function once for the whole loop
+            wallet_instance = self._get_wallet(self.wallet_data["seed"], address)
+            sign_offer = _sign_offer
+            signed_txs = [
+                sign_offer(address, wallet_instance, nft_id, destination, first_sequence + i)
+                for i, (nft_id, destination) in enumerate(pairs)
+            ]
+            
+            logger.info("Submitting %s transfers from sequence %s", len(signed_txs), first_sequence)
+            response = self._post_json(
+                CFG.submit_batch_url,
+                {"account": address, "signed_transactions": signed_txs}
             )
             
-            # Sign the transaction
-            wallet_instance = Wallet.from_seed(self.wallet_data["seed"])
-            signed_tx = sign(offer_tx, wallet_instance)
-            tx_blob = binarycodec.encode(signed_tx.to_xrpl())
+            if response.status_code != 200:
+                error_msg = orjson.loads(response.content).get('error', 'Unknown error')
+                raise Exception(f"Failed to submit transfers: {error_msg}")
+            
+            result = orjson.loads(response.content)
+            if result.get("status") != "success":
+                self._reset_sequence(address)
+            else:
+                self._check_sequence_result(address, result)
+            self.call_from_thread(self._result_display.update, f"[green]{result.get('count', 0)} NFT transfers submitted![/]\n{_render_result(result)}")
+            
+        except Exception as e:
+            logger.error("Error transferring NFTs: %s", e)
+            self._reset_sequence(address)
+            self.call_from_thread(self._result_display.update, f"[red]Error transferring NFTs: {str(e)}[/]")
+
+    @work
+    async def transfer_nft(self, nft_id: str, destination: str):
+        """Transfer an NFT to another address."""
+        address = self.wallet_data["classic_address"]
+        try:
+            # Reject malformed input before any network round-trip
+            _check_transfer_input(nft_id, destination, address)
+            self._result_display.update("[yellow]Preparing NFT transfer...[/]")
+            loop = asyncio.get_running_loop()
+            
+            current_sequence = await asyncio.to_thread(self._next_sequence, address)
+            logger.info("Using sequence number: %s", current_sequence)
             
-            # Submit the transaction
+            # Key derivation, signing and encoding are CPU-bound; keep them off the event loop
+            signed_tx = await loop.run_in_executor(
+                self._crypto_pool, self._build_offer_tx, nft_id, destination, current_sequence
+            )
             submit_data = {
-                "signed_transaction": {
-                    "tx_blob": tx_blob,
-                    "hash": signed_tx.get_hash(),
-                    "sequence": current_sequence,
-                    "account": self.wallet_data["classic_address"]
-                },
-                "account": self.wallet_data["classic_address"],
+                "signed_transaction": signed_tx,
+                "account": address,
                 "destination": destination
             }
             
-            logger.info(f"Submitting transfer transaction with sequence {current_sequence}")
-            response = requests.post(
-                f"{BACKEND_BASE_URL}{SUBMIT_TRANSACTION_ROUTE}",
-                json=submit_data
-            )
+            logger.info("Submitting transfer transaction with sequence %s", current_sequence)
+            response = await self._apost_json(CFG.submit_url, submit_data)
             
             if response.status_code != 200:
-                error_msg = response.json().get('error', 'Unknown error')
+                error_msg = orjson.loads(response.content).get('error', 'Unknown error')
                 raise Exception(f"Failed to submit transfer: {error_msg}")
             
-            result = response.json()
-            def show_success():
-                try:
-                    result_display = self.query_one("#result-display", ResultDisplay)
-                    if result_display:
-                        result_display.update(f"[green]NFT transfer initiated successfully![/]\n{Pretty(result)}")
-                except Exception as ui_error:
-                    logger.error(f"Error showing success message: {str(ui_error)}")
-            
-            self.call_from_thread(show_success)
+            result = orjson.loads(response.content)
+            self._check_sequence_result(address, result)
+            rendered = await asyncio.to_thread(_render_result, result)
+            self._result_display.update(f"[green]NFT transfer initiated successfully![/]\n{rendered}")
             
         except Exception as e:
-            logger.error(f"Error transferring NFT: {str(e)}")
-            def show_error():
-                try:
-                    result_display = self.query_one("#result-display", ResultDisplay)
-                    if result_display:
-                        result_display.update(f"[red]Error transferring NFT: {str(e)}[/]")
-                except Exception as ui_error:
-                    logger.error(f"Error showing error message: {str(ui_error)}")
-            
-            self.call_from_thread(show_error)
+            logger.error("Error transferring NFT: %s", e)
+            self._reset_sequence(address)
+            self._result_display.update(f"[red]Error transferring NFT: {str(e)}[/]")
 
 if __name__ == "__main__":
     app = NFTApp()
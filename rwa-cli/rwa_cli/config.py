@@ -1,8 +1,27 @@
+from dataclasses import dataclass
+import re
+
 # Constants
 XRPL_TESTNET_URL = "https://s.altnet.rippletest.net:51234"
+XRPL_TESTNET_WS_URL = "wss://s.altnet.rippletest.net:51233"
+XRPL_WS_IDLE_TIMEOUT = 120  # seconds before an idle websocket is closed
+FAUCET_URL = "https://faucet.altnet.rippletest.net/accounts"
 BACKEND_BASE_URL = "http://localhost:5000"
-MINT_TEMPLATE_ROUTE = "/api/transaction/nft/mint/template"
 SUBMIT_TRANSACTION_ROUTE = "/api/transaction/submit"
+SUBMIT_BATCH_ROUTE = "/api/transaction/submit/batch"
 NFT_VIEW_ROUTE = "/api/transaction/nfts/{address}"
 WALLETS_DIR = "wallets"
-CURRENT_WALLET_FILE = "current_wallet.json" 
\ No newline at end of file
+CURRENT_WALLET_FILE = "current_wallet.json"
+HTTP_TIMEOUT = (3, 10)  # (connect, read) seconds
+
+# Shape check for NFT IDs in transfer input, compiled once
+NFT_ID_RE = re.compile(r"^[0-9A-Fa-f]{64}$")
+
+@dataclass(frozen=True)
+class _Cfg:
+    """Full backend URLs, joined once at import instead of on every request."""
+    submit_url: str = BACKEND_BASE_URL + SUBMIT_TRANSACTION_ROUTE
+    submit_batch_url: str = BACKEND_BASE_URL + SUBMIT_BATCH_ROUTE
+    nft_view_url: str = BACKEND_BASE_URL + NFT_VIEW_ROUTE  # format with address=
+
+CFG = _Cfg()
@@ -14,26 +14,111 @@ from textual.widgets import (
 )
 from textual.events import Key
 from rich.text import Text
+from xrpl.core.addresscodec import is_valid_classic_address
 import datetime
-import requests
-from config import BACKEND_BASE_URL, NFT_VIEW_ROUTE
+from functools import lru_cache
+from config import CFG
 import logging
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+ASSET_TYPES = (
+    ("Real Estate", "Real Estate"),
+    ("Art", "Art"),
+    ("Collectibles", "Collectibles"),
+    ("Vehicles", "Vehicles"),
+    ("Financial Instruments", "Financial Instruments"),
+    ("Commodities", "Commodities")
+)
+
+# Most wallet address labels kept prebuilt (two states per wallet)
+_WALLET_LABEL_CACHE_SIZE = 128
+
+# Seconds to wait for further refresh requests before reloading a list
+_REFRESH_DEBOUNCE = 0.05
+
+# Markup templates for NFT detail panels, filled with format_map
+_LIST_NFT_TMPL = (
+    "[bold green]Title:[/] {title}\n"
+    "[bold green]Type:[/] {asset_type}\n"
+    "[bold green]Location:[/] {location}\n"
+    "[bold green]Documentation ID:[/] {documentation_id}"
+)
+_DETAILS_TMPL = (
+    "[bold blue]Selected NFT Details:[/]\n"
+    "[bold green]Title:[/] {title}\n"
+    "[bold green]Type:[/] {asset_type}\n"
+    "[bold green]Location:[/] {location}\n"
+    "[bold green]Documentation ID:[/] {documentation_id}\n"
+    "[bold green]Description:[/] {description}\n"
+    "[bold green]NFT ID:[/] {nft_id}\n"
+    "[bold green]Status:[/] {status}\n"
+    "[bold green]Transaction Hash:[/] {transaction_hash}"
+)
+_CONFIRM_TMPL = (
+    "[bold red]Confirm NFT Transfer[/]\n\n"
+    "You are about to transfer:\n"
+    "[bold green]{title}[/]\n"
+    "Type: {asset_type}\n"
+    "NFT ID: {nft_id}\n"
+    "To: {destination}\n\n"
+    "[bold yellow]This action cannot be undone![/]"
+)
+_CONFIRM_BATCH_TMPL = (
+    "[bold red]Confirm NFT Transfer[/]\n\n"
+    "You are about to transfer {count} NFTs:\n"
+    "{titles}\n"
+    "To: {destination}\n\n"
+    "[bold yellow]This action cannot be undone![/]"
+)
+_CONFIRM_BATCH_LINE = "[bold green]{title}[/] ({asset_type})"
+_LISTING_TMPL = (
+    "[bold green]NFT ID:[/] {nft_id}\n"
+    "[bold green]Seller:[/] {seller_address}\n"
+    "[bold green]Price:[/] {price_xrp} XRP"
+)
+
+class _Defaulting(dict):
+    """Template fields that render as 'Unknown' when absent."""
+
+    def __missing__(self, key):
+        return "Unknown"
+
+@lru_cache(maxsize=_WALLET_LABEL_CACHE_SIZE)
+def _wallet_label_text(address: str, is_current: bool) -> Text:
+    """Build the address line of a wallet row, once per wallet and state."""
+    return Text.assemble(
+        ("[Current] Address:" if is_current else "Address:", "bold green" if is_current else "bold blue"),
+        f" {address}"
+    )
+
+def _dispatch_button(screen: Screen, button_id, handlers: dict, prefix_handlers: dict) -> None:
+    """Route a button id to a screen method by exact id, else by its "prefix_" part."""
+    if button_id is None:
+        return
+    handler = handlers.get(button_id)
+    if handler is not None:
+        getattr(screen, handler)()
+        return
+    prefix, sep, rest = button_id.partition("_")
+    handler = prefix_handlers.get(prefix) if sep else None
+    if handler is not None:
+        getattr(screen, handler)(rest)
+
+def _nft_card_text(metadata: dict, nft_id: str) -> Text:
+    """Build the styled title/type/ID lines for an NFT row without markup parsing."""
+    return Text.assemble(
+        (metadata.get('title', 'Untitled'), "bold green"),
+        " (",
+        (metadata.get('asset_type', 'Unknown'), "blue"),
+        ")\n",
+        (f"ID: {nft_id}", "dim")
+    )
+
 class MintScreen(Screen):
     """Screen for minting a new RWA NFT."""
 
-    ASSET_TYPES = [
-        ("Real Estate", "Real Estate"),
-        ("Art", "Art"),
-        ("Collectibles", "Collectibles"),
-        ("Vehicles", "Vehicles"),
-        ("Financial Instruments", "Financial Instruments"),
-        ("Commodities", "Commodities")
-    ]
-
     CSS = """
     .form-container {
         height: auto;
@@ -67,7 +152,7 @@ class MintScreen(Screen):
             Vertical(
                 Label("Asset Type"),
                 Select(
-                    self.ASSET_TYPES,
+                    ASSET_TYPES,
                     id="asset_type",
                     value="Real Estate"
                 ),
@@ -105,7 +190,7 @@ class MintScreen(Screen):
             "location": self.query_one("#location", Input).value,
             "documentation_id": self.query_one("#documentation_id", Input).value,
             "type": "RWA",  # Identify this as a Real World Asset NFT
-            "created_at": str(datetime.datetime.now())
+            "created_at": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds")
         }
 
         # Validate required fields
@@ -154,12 +239,7 @@ class ListNFTScreen(Screen):
         yield Container(
             Vertical(
                 Label(f"[bold blue]List NFT for Sale[/]"),
-                Static(
-                    f"[bold green]Title:[/] {metadata.get('title', 'Unknown')}\n"
-                    f"[bold green]Type:[/] {metadata.get('asset_type', 'Unknown')}\n"
-                    f"[bold green]Location:[/] {metadata.get('location', 'Unknown')}\n"
-                    f"[bold green]Documentation ID:[/] {metadata.get('documentation_id', 'Unknown')}"
-                ),
+                Static(_LIST_NFT_TMPL.format_map(_Defaulting(metadata))),
                 Label("[bold]Enter Sale Price[/]"),
                 Input(id="price", placeholder="Enter price in XRP"),
                 Container(
@@ -196,8 +276,7 @@ class ListNFTScreen(Screen):
                 return
 
             # Pop all screens to return to main screen
-            while self.app.screen_stack:
-                self.app.pop_screen()
+            self.app.pop_to_root()
                 
             # Trigger NFT listing
             self.app.list_nft_for_sale(self.nft_data, price_xrp)
@@ -208,6 +287,9 @@ class ListNFTScreen(Screen):
 class MarketplaceScreen(Screen):
     """Screen for viewing marketplace listings."""
 
+    _BUTTON_HANDLERS = {"back": "_on_back", "refresh": "_schedule_refresh"}
+    _PREFIX_HANDLERS = {"buy": "_on_buy"}
+
     CSS = """
     .listings-container {
         height: auto;
@@ -231,6 +313,13 @@ class MarketplaceScreen(Screen):
     }
     """
 
+    def __init__(self):
+        super().__init__()
+        self._refresh_timer = None
+        # Mounted row per listing ID, so refreshes only touch what changed
+        self._listing_rows = {}
+        self._listings = {}
+
     def compose(self) -> ComposeResult:
         """Create child widgets for the screen."""
         yield Header()
@@ -248,26 +337,82 @@ class MarketplaceScreen(Screen):
 
     def on_mount(self) -> None:
         """Load listings when screen is mounted."""
-        self.load_listings()
+        self._schedule_refresh()
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button presses."""
-        if event.button.id == "back":
-            self.app.pop_screen()
-        elif event.button.id == "refresh":
-            self.load_listings()
-        elif event.button.id.startswith("buy_"):
-            listing_id = event.button.id.replace("buy_", "")
-            self.app.buy_nft(listing_id)
+        _dispatch_button(self, event.button.id, self._BUTTON_HANDLERS, self._PREFIX_HANDLERS)
+
+    def _on_back(self) -> None:
+        """Return to the previous screen."""
+        self.app.pop_screen()
+
+    def _on_buy(self, listing_id: str) -> None:
+        """Buy the listing behind the pressed button."""
+        self.app.buy_nft(listing_id)
+
+    def _schedule_refresh(self) -> None:
+        """Coalesce refresh requests arriving within the debounce window into one load."""
+        if self._refresh_timer is not None:
+            self._refresh_timer.stop()
+        self._refresh_timer = self.set_timer(_REFRESH_DEBOUNCE, self.load_listings)
 
     def load_listings(self) -> None:
-        """Load and display marketplace listings."""
-        self.query_one("#listings").remove_children()
+        """Load marketplace listings; the app hands them back through show_listings."""
+        self._refresh_timer = None
         self.app.load_marketplace_listings(self)
 
+    def show_listings(self, listings: list) -> None:
+        """Display listings, keyed by listing ID so only changed rows are touched."""
+        listings_container = self.query_one("#listings")
+        by_id = {listing['listing_id']: listing for listing in listings}
+
+        if not by_id:
+            listings_container.remove_children()
+            self._listing_rows.clear()
+            self._listings = {}
+            listings_container.mount(Static("[yellow]No active listings[/]"))
+            return
+
+        # Drop rows for listings that are gone (or the "no listings" placeholder)
+        if not self._listing_rows:
+            listings_container.remove_children()
+        for listing_id in self._listing_rows.keys() - by_id.keys():
+            self._listing_rows.pop(listing_id).remove()
+
+        new_rows = []
+        for listing_id, listing in by_id.items():
+            row = self._listing_rows.get(listing_id)
+            if row is None:
+                row = self._listing_rows[listing_id] = Container(
+                    Static(self._listing_text(listing)),
+                    Button("Buy", variant="success", id=f"buy_{listing_id}"),
+                    classes="listing"
+                )
+                new_rows.append(row)
+            elif self._listings.get(listing_id) != listing:
+                # Same listing, new data (e.g. a price change): update it in place
+                row.query_one(Static).update(self._listing_text(listing))
+        self._listings = by_id
+
+        if new_rows:
+            with self.app.batch_update():
+                listings_container.mount(*new_rows)
+
+    @staticmethod
+    def _listing_text(listing: dict) -> str:
+        """Format one listing's details."""
+        fields = _Defaulting(listing)
+        if 'price_drops' in listing:
+            fields['price_xrp'] = listing['price_drops'] / 1_000_000
+        return _LISTING_TMPL.format_map(fields)
+
 class NFTSelectionScreen(Screen):
     """Screen for selecting an NFT to sell."""
 
+    _BUTTON_HANDLERS = {"back": "_on_back"}
+    _PREFIX_HANDLERS = {"sell": "_on_sell"}
+
     CSS = """
     .nft-grid {
         layout: grid;
@@ -318,30 +463,37 @@ class NFTSelectionScreen(Screen):
         """Create a card widget for an NFT."""
         metadata = nft.get('full_metadata', {})
         return Container(
-            Static(
-                f"[bold green]{metadata.get('title', 'Untitled')}[/]\n"
-                f"Type: {metadata.get('asset_type', 'Unknown')}\n"
-                f"Location: {metadata.get('location', 'Unknown')}"
-            ),
+            Static(Text.assemble(
+                (metadata.get('title', 'Untitled'), "bold green"),
+                f"\nType: {metadata.get('asset_type', 'Unknown')}",
+                f"\nLocation: {metadata.get('location', 'Unknown')}"
+            )),
             Button("Sell This NFT", variant="success", id=f"sell_{index}"),
             classes="nft-card"
         )
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button presses."""
-        if event.button.id == "back":
-            self.app.pop_screen()
-        elif event.button.id.startswith("sell_"):
-            index = int(event.button.id.replace("sell_", ""))
-            self.app.push_screen(ListNFTScreen(self.nfts[index])) 
+        _dispatch_button(self, event.button.id, self._BUTTON_HANDLERS, self._PREFIX_HANDLERS)
+
+    def _on_back(self) -> None:
+        """Return to the previous screen."""
+        self.app.pop_screen()
+
+    def _on_sell(self, index: str) -> None:
+        """Open the listing form for the chosen NFT."""
+        self.app.push_screen(ListNFTScreen(self.nfts[int(index)]))
 
 class TransferScreen(Screen):
-    """Screen for transferring an NFT to another address."""
+    """Screen for transferring one or more NFTs to another address."""
 
     BINDINGS = [
         ("escape", "app.pop_screen", "Back"),
     ]
 
+    _BUTTON_HANDLERS = {"cancel": "_on_cancel", "submit": "_on_submit", "refresh": "_schedule_refresh"}
+    _PREFIX_HANDLERS = {"select": "select_nft"}
+
     CSS = """
     .form-container {
         height: 100%;
@@ -439,8 +591,17 @@ class TransferScreen(Screen):
         super().__init__()
         self.selected_nft = None
         self.selected_nft_data = None
+        # Every NFT picked for transfer, in the order it was selected
+        self.selected_ids = {}
         self.confirmation_mode = False
         self.nfts = []
+        self._nft_by_id = {}
+        # Mounted row per NFT ID, so refreshes only touch what changed
+        self._nft_rows = {}
+        # Card text per NFT ID, built once and reused until the NFT changes
+        self._card_texts = {}
+        self._confirmation_dialog = None
+        self._refresh_timer = None
 
     def compose(self) -> ComposeResult:
         """Create child widgets for the screen."""
@@ -448,7 +609,7 @@ class TransferScreen(Screen):
         yield Container(
             Vertical(
                 Label("[bold blue]Transfer NFT[/]"),
-                Label("[dim]Select an NFT to transfer:[/]"),
+                Label("[dim]Select one or more NFTs to transfer:[/]"),
                 Container(
                     Static("[yellow]Loading NFTs...[/]"),
                     id="nft-list",
@@ -469,6 +630,7 @@ class TransferScreen(Screen):
                         ),
                         Container(
                             Button("Cancel", variant="error", id="cancel"),
+                            Button("Refresh", variant="primary", id="refresh"),
                             Button("Transfer", variant="success", id="submit", disabled=True),
                             classes="button-row"
                         ),
@@ -484,7 +646,18 @@ class TransferScreen(Screen):
         """Load NFTs when screen is mounted."""
         logger.info("TransferScreen mounted, loading NFTs...")
         self.show_loading()
-        self.load_nfts()
+        self._schedule_refresh()
+
+    def _schedule_refresh(self) -> None:
+        """Coalesce refresh requests arriving within the debounce window into one load."""
+        if self._refresh_timer is not None:
+            self._refresh_timer.stop()
+        self._refresh_timer = self.set_timer(_REFRESH_DEBOUNCE, self._do_refresh)
+
+    def _do_refresh(self) -> None:
+        """Reload the NFT list, replacing any load still in flight."""
+        self._refresh_timer = None
+        self.run_worker(self.load_nfts(), exclusive=True)
 
     def show_loading(self) -> None:
         """Show loading state."""
@@ -497,160 +670,204 @@ class TransferScreen(Screen):
             )
         )
 
-    def load_nfts(self) -> None:
-        """Load user's NFTs."""
+    async def load_nfts(self) -> None:
+        """Load user's NFTs without blocking the event loop on the request.
+
+        Rows are keyed by NFT ID: a refresh only removes, mounts or
+        updates the rows whose NFTs changed.
+        """
         try:
-            # Show initial loading message
             nft_list = self.query_one("#nft-list")
-            nft_list.remove_children()
-            nft_list.mount(Static("[yellow]Fetching NFTs from blockchain...[/]"))
+            if not self._nft_rows:
+                # Show initial loading message
+                await nft_list.remove_children()
+                nft_list.mount(Static("[yellow]Fetching NFTs from blockchain...[/]"))
 
             logger.info("Fetching NFTs from backend...")
-            response = requests.get(
-                f"{BACKEND_BASE_URL}{NFT_VIEW_ROUTE.format(address=self.app.wallet_data['classic_address'])}"
-            )
+            url = CFG.nft_view_url.format(address=self.app.wallet_data['classic_address'])
+            response = await self.app.fetch(url)
             
-            logger.info(f"Response status code: {response.status_code}")
+            logger.info("Response status code: %s", response.status_code)
             if response.status_code != 200:
                 self.notify("Failed to load NFTs", severity="error")
-                nft_list.remove_children()
-                nft_list.mount(Static("[red]Failed to load NFTs[/]"))
+                await self._show_list_message("[red]Failed to load NFTs[/]")
                 return
 
             try:
                 response_data = response.json()
-                logger.info(f"Full response data: {response_data}")
+                logger.debug("Full response data: %s", response_data)
                 
                 if not isinstance(response_data, dict) or 'nfts' not in response_data:
-                    logger.error(f"Invalid response format. Expected dict with 'nfts' key. Got: {type(response_data)}")
+                    logger.error("Invalid response format. Expected dict with 'nfts' key. Got: %s", type(response_data))
                     self.notify("Invalid response format from server", severity="error")
-                    nft_list.remove_children()
-                    nft_list.mount(Static("[red]Invalid response from server[/]"))
+                    await self._show_list_message("[red]Invalid response from server[/]")
                     return
 
                 self.nfts = response_data.get('nfts', [])
-                logger.info(f"Found {len(self.nfts)} NFTs")
-                logger.info(f"NFTs data: {self.nfts}")
-
-                # Clear the loading message
-                nft_list.remove_children()
+                logger.info("Found %s NFTs", len(self.nfts))
+                logger.debug("NFTs data: %s", self.nfts)
 
                 if not self.nfts:
-                    nft_list.mount(Static("[yellow]No NFTs found in this wallet[/]"))
+                    self._nft_by_id = {}
+                    await self._show_list_message("[yellow]No NFTs found in this wallet[/]")
                     return
 
-                # Process and display all NFTs
-                valid_nfts = []
+                # Keep only well-formed NFTs
+                nft_by_id = {}
                 for nft in self.nfts:
-                    logger.info(f"Processing NFT: {nft}")
+                    logger.debug("Processing NFT: %s", nft)
                     if not isinstance(nft, dict):
-                        logger.warning(f"Invalid NFT data format: {nft}")
+                        logger.warning("Invalid NFT data format: %s", nft)
                         continue
 
                     if 'nft_id' not in nft:
-                        logger.warning(f"NFT missing nft_id: {nft}")
+                        logger.warning("NFT missing nft_id: %s", nft)
                         continue
 
-                    # Try both metadata locations
-                    metadata = nft.get('metadata', {})
-                    if not metadata:
-                        metadata = nft.get('full_metadata', {})
-                    
-                    logger.info(f"NFT metadata: {metadata}")
-
-                    nft_container = Container(
-                        Container(
-                            Static(
-                                f"[bold green]{metadata.get('title', 'Untitled')}[/] "
-                                f"([blue]{metadata.get('asset_type', 'Unknown')}[/])\n"
-                                f"[dim]ID: {nft['nft_id']}[/]"
-                            ),
-                            classes="nft-info"
-                        ),
-                        Container(
-                            Button("Select", variant="primary", id=f"select_{nft['nft_id']}"),
-                            classes="nft-button"
-                        ),
-                        classes="nft-item",
-                        id=f"container_{nft['nft_id']}"
-                    )
-                    valid_nfts.append(nft_container)
-
-                # Mount all valid NFTs at once
-                for nft_container in valid_nfts:
-                    nft_list.mount(nft_container)
+                    nft_by_id[nft['nft_id']] = nft
+
+                previous, self._nft_by_id = self._nft_by_id, nft_by_id
+
+                # Drop rows for NFTs that are gone (or the loading/status message)
+                if not self._nft_rows:
+                    await nft_list.remove_children()
+                for nft_id in self._nft_rows.keys() - nft_by_id.keys():
+                    self._nft_rows.pop(nft_id).remove()
+                    self._card_texts.pop(nft_id, None)
+                    self.selected_ids.pop(nft_id, None)
+
+                new_rows = []
+                for nft_id, nft in nft_by_id.items():
+                    row = self._nft_rows.get(nft_id)
+                    if row is None:
+                        row = self._nft_rows[nft_id] = self._build_nft_row(nft)
+                        new_rows.append(row)
+                    elif previous.get(nft_id) != nft:
+                        # Same NFT, new data: rebuild its card and update it in place
+                        self._card_texts.pop(nft_id, None)
+                        row.query_one(".nft-info Static", Static).update(self._card_text(nft))
+
+                # Mount all new NFTs at once
+                if new_rows:
+                    with self.app.batch_update():
+                        nft_list.mount(*new_rows)
+                self._show_selection()
 
             except Exception as json_error:
-                logger.error(f"Error processing response: {str(json_error)}")
+                logger.error("Error processing response: %s", json_error)
                 self.notify("Error processing server response", severity="error")
-                nft_list.remove_children()
-                nft_list.mount(Static(f"[red]Error: {str(json_error)}[/]"))
+                await self._show_list_message(f"[red]Error: {str(json_error)}[/]")
                 return
 
         except Exception as e:
-            logger.error(f"Error in load_nfts: {str(e)}")
+            logger.error("Error in load_nfts: %s", e)
             self.notify(f"Error loading NFTs: {str(e)}", severity="error")
-            nft_list = self.query_one("#nft-list")
-            nft_list.remove_children()
-            nft_list.mount(Static(f"[red]Error loading NFTs: {str(e)}[/]"))
+            await self._show_list_message(f"[red]Error loading NFTs: {str(e)}[/]")
+
+    async def _show_list_message(self, message: str) -> None:
+        """Replace every NFT row with a single status message."""
+        nft_list = self.query_one("#nft-list")
+        await nft_list.remove_children()
+        self._nft_rows.clear()
+        self._card_texts.clear()
+        self.selected_ids.clear()
+        self._show_selection()
+        nft_list.mount(Static(message))
+
+    def _card_text(self, nft: dict) -> Text:
+        """Return an NFT's card text, memoised by NFT ID."""
+        nft_id = nft['nft_id']
+        text = self._card_texts.get(nft_id)
+        if text is None:
+            metadata = nft.get('metadata') or nft.get('full_metadata', {})
+            text = self._card_texts[nft_id] = _nft_card_text(metadata, nft_id)
+        return text
+
+    def _build_nft_row(self, nft: dict) -> Container:
+        """Create the row widget for one NFT."""
+        nft_id = nft['nft_id']
+        selected = nft_id in self.selected_ids
+        return Container(
+            Container(
+                Static(self._card_text(nft)),
+                classes="nft-info"
+            ),
+            Container(
+                Button("Deselect" if selected else "Select", variant="primary", id=f"select_{nft_id}"),
+                classes="nft-button"
+            ),
+            classes="nft-item selected" if selected else "nft-item",
+            id=f"container_{nft_id}"
+        )
 
     def select_nft(self, nft_id: str) -> None:
-        """Select an NFT for transfer and show its details."""
+        """Add an NFT to the transfer selection, or drop it if already selected."""
         try:
-            selected_nft = next((nft for nft in self.nfts if nft['nft_id'] == nft_id), None)
+            selected_nft = self._nft_by_id.get(nft_id)
             
             if not selected_nft:
                 self.notify("NFT not found", severity="error")
                 return
 
-            self.selected_nft = nft_id
-            self.selected_nft_data = selected_nft
-            self.query_one("#submit").disabled = False
-
-            # Update UI to show selection
-            for container in self.query(Container):
-                if container.id and container.id.startswith("container_"):
-                    if container.id == f"container_{nft_id}":
-                        container.add_class("selected")
-                    else:
-                        container.remove_class("selected")
-
-            # Show NFT details
-            details = self.query_one("#nft-details")
-            metadata = selected_nft.get('full_metadata', {})
-            details_text = (
-                f"[bold blue]Selected NFT Details:[/]\n"
-                f"[bold green]Title:[/] {metadata.get('title', 'Untitled')}\n"
-                f"[bold green]Type:[/] {metadata.get('asset_type', 'Unknown')}\n"
-                f"[bold green]Location:[/] {metadata.get('location', 'Unknown')}\n"
-                f"[bold green]Documentation ID:[/] {metadata.get('documentation_id', 'Unknown')}\n"
-                f"[bold green]Description:[/] {metadata.get('description', 'No description')}\n"
-                f"[bold green]NFT ID:[/] {nft_id}\n"
-                f"[bold green]Status:[/] {selected_nft.get('status', 'Unknown')}\n"
-                f"[bold green]Transaction Hash:[/] {selected_nft.get('transaction_hash', 'Unknown')}"
-            )
-            details.update(Static(details_text))
-            details.add_class("visible")
+            # Update UI to show selection, touching only the toggled row
+            container = self._nft_rows[nft_id]
+            button = container.query_one(f"#select_{nft_id}", Button)
+            if nft_id in self.selected_ids:
+                del self.selected_ids[nft_id]
+                container.remove_class("selected")
+                button.label = "Select"
+            else:
+                self.selected_ids[nft_id] = None
+                container.add_class("selected")
+                button.label = "Deselect"
+            self._show_selection()
 
         except Exception as e:
-            logger.error(f"Error selecting NFT: {str(e)}")
+            logger.error("Error selecting NFT: %s", e)
             self.notify(f"Error selecting NFT: {str(e)}", severity="error")
 
+    def _show_selection(self) -> None:
+        """Enable Transfer and show the details of the most recently selected NFT."""
+        self.query_one("#submit").disabled = not self.selected_ids
+        details = self.query_one("#nft-details")
+        if not self.selected_ids:
+            self.selected_nft = None
+            self.selected_nft_data = None
+            details.remove_class("visible")
+            return
+        nft_id = next(reversed(self.selected_ids))
+        if nft_id == self.selected_nft and self.selected_nft_data is self._nft_by_id[nft_id]:
+            return
+        self.selected_nft = nft_id
+        self.selected_nft_data = self._nft_by_id[nft_id]
+        metadata = self.selected_nft_data.get('full_metadata', {})
+        fields = _Defaulting(title='Untitled', description='No description')
+        fields.update(metadata)
+        fields.update(
+            nft_id=nft_id,
+            status=self.selected_nft_data.get('status', 'Unknown'),
+            transaction_hash=self.selected_nft_data.get('transaction_hash', 'Unknown')
+        )
+        details.query_one(Static).update(_DETAILS_TMPL.format_map(fields))
+        details.add_class("visible")
+
     def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button presses."""
-        if event.button.id == "cancel":
-            if self.confirmation_mode:
-                self._exit_confirmation_mode()
-            else:
-                self.app.pop_screen()
-        elif event.button.id == "submit":
-            if self.confirmation_mode:
-                self.transfer_nft()
-            else:
-                self._show_confirmation()
-        elif event.button.id.startswith("select_"):
-            nft_id = event.button.id.replace("select_", "")
-            self.select_nft(nft_id)
+        _dispatch_button(self, event.button.id, self._BUTTON_HANDLERS, self._PREFIX_HANDLERS)
+
+    def _on_cancel(self) -> None:
+        """Leave confirmation mode, or the screen if not confirming."""
+        if self.confirmation_mode:
+            self._exit_confirmation_mode()
+        else:
+            self.app.pop_screen()
+
+    def _on_submit(self) -> None:
+        """Ask for confirmation, or transfer once confirmed."""
+        if self.confirmation_mode:
+            self.transfer_nft()
+        else:
+            self._show_confirmation()
 
     def _show_confirmation(self) -> None:
         """Show transfer confirmation dialog."""
@@ -660,29 +877,38 @@ class TransferScreen(Screen):
             self.notify("Please enter a destination address", severity="error")
             return
             
-        if not self.selected_nft:
+        if not self.selected_ids:
             self.notify("Please select an NFT to transfer", severity="error")
             return
 
         # Basic XRPL address validation
-        if not destination.startswith('r') or len(destination) < 25:
+        if not is_valid_classic_address(destination):
             self.notify("Invalid destination address format", severity="error")
             return
 
         self.confirmation_mode = True
-        metadata = self.selected_nft_data.get('full_metadata', {})
+        if len(self.selected_ids) == 1:
+            metadata = self.selected_nft_data.get('full_metadata', {})
+            message = _CONFIRM_TMPL.format_map(_Defaulting(
+                metadata,
+                title=metadata.get('title', 'Untitled'),
+                nft_id=self.selected_nft,
+                destination=destination
+            ))
+        else:
+            titles = "\n".join(
+                _CONFIRM_BATCH_LINE.format_map(_Defaulting(
+                    {'title': 'Untitled', **self._nft_by_id[nft_id].get('full_metadata', {})}
+                ))
+                for nft_id in self.selected_ids
+            )
+            message = _CONFIRM_BATCH_TMPL.format(
+                count=len(self.selected_ids), titles=titles, destination=destination
+            )
         
         # Create confirmation dialog
         dialog = Container(
-            Static(
-                f"[bold red]Confirm NFT Transfer[/]\n\n"
-                f"You are about to transfer:\n"
-                f"[bold green]{metadata.get('title', 'Untitled')}[/]\n"
-                f"Type: {metadata.get('asset_type', 'Unknown')}\n"
-                f"NFT ID: {self.selected_nft}\n"
-                f"To: {destination}\n\n"
-                f"[bold yellow]This action cannot be undone![/]"
-            ),
+            Static(message),
             Container(
                 Button("Cancel", variant="primary", id="cancel"),
                 Button("Confirm Transfer", variant="warning", id="submit"),
@@ -691,30 +917,35 @@ class TransferScreen(Screen):
             classes="confirmation-dialog"
         )
         
+        self._confirmation_dialog = dialog
         self.query_one(".form-container").mount(dialog)
 
     def _exit_confirmation_mode(self) -> None:
         """Exit confirmation mode."""
         self.confirmation_mode = False
         # Remove confirmation dialog
-        for container in self.query(".confirmation-dialog"):
-            container.remove()
+        if self._confirmation_dialog is not None:
+            self._confirmation_dialog.remove()
+            self._confirmation_dialog = None
 
     def transfer_nft(self) -> None:
-        """Transfer the selected NFT."""
+        """Transfer the selected NFTs, in one batch when there are several."""
         destination = self.query_one("#destination", Input).value
         
         if not destination:
             self.notify("Please enter a destination address", severity="error")
             return
             
-        if not self.selected_nft:
+        if not self.selected_ids:
             self.notify("Please select an NFT to transfer", severity="error")
             return
 
         # Return to main screen and trigger NFT transfer
         self.app.pop_screen()
-        self.app.transfer_nft(self.selected_nft, destination) 
+        if len(self.selected_ids) == 1:
+            self.app.transfer_nft(self.selected_nft, destination)
+        else:
+            self.app.transfer_nfts_batch([(nft_id, destination) for nft_id in self.selected_ids])
 
 class WalletSelectionScreen(Screen):
     """Screen for managing and selecting wallets."""
@@ -722,9 +953,13 @@ class WalletSelectionScreen(Screen):
     BINDINGS = [
         ("b", "back", "Back to Menu"),
         ("g", "generate", "Generate Wallet"),
-        ("i", "import", "Import Wallet")
+        ("i", "import", "Import Wallet"),
+        ("r", "refresh", "Refresh Balances")
     ]
 
+    _BUTTON_HANDLERS = {"back": "_on_back", "generate": "_on_generate", "import": "_on_import"}
+    _PREFIX_HANDLERS = {"select": "_on_select", "remove": "_on_remove"}
+
     CSS = """
     Screen {
         align: center middle;
@@ -759,6 +994,7 @@ class WalletSelectionScreen(Screen):
 
     .wallet-info {
         width: 70%;
+        height: auto;
         margin-right: 1;
         content-align: left middle;
     }
@@ -798,6 +1034,12 @@ class WalletSelectionScreen(Screen):
     }
     """
 
+    def __init__(self):
+        super().__init__()
+        # Mounted row per wallet address, so refreshes only touch what changed
+        self._wallet_rows = {}
+        self._shown_current = None
+
     def compose(self) -> ComposeResult:
         """Create child widgets for the screen."""
         yield Header()
@@ -817,70 +1059,147 @@ class WalletSelectionScreen(Screen):
         yield Footer()
 
     def on_mount(self) -> None:
-        """Load wallets when screen is mounted."""
+        """Load wallets and fetch their balances when screen is mounted."""
         self.load_wallets()
+        self.action_refresh()
 
     def load_wallets(self) -> None:
-        """Load and display available wallets."""
+        """Load and display available wallets, remounting only rows that changed."""
         try:
             wallets = self.app.load_all_wallets()
             wallet_list = self.query_one("#wallet-list")
-            wallet_list.remove_children()
 
             if not wallets:
+                wallet_list.remove_children()
+                self._wallet_rows.clear()
+                self._shown_current = None
                 wallet_list.mount(Static("[yellow]No wallets found[/]"))
                 return
 
             current_wallet = self.app.wallet_data.get('classic_address') if self.app.wallet_data else None
 
+            # Drop rows for removed wallets (or the "no wallets" placeholder)
+            addresses = {w['classic_address'] for w in wallets}
+            if not self._wallet_rows:
+                wallet_list.remove_children()
+            for address in self._wallet_rows.keys() - addresses:
+                self._wallet_rows.pop(address).remove()
+
+            # Restyle only the rows whose current/not-current state flipped
+            if current_wallet != self._shown_current:
+                for address in (self._shown_current, current_wallet):
+                    if address in self._wallet_rows:
+                        self._mark_current(address, address == current_wallet)
+                self._shown_current = current_wallet
+
+            wallet_containers = []
             for wallet in wallets:
-                is_current = wallet['classic_address'] == current_wallet
-                wallet_container = Container(
-                    Static(
-                        f"[bold {'green' if is_current else 'blue'}]"
-                        f"{'[Current] ' if is_current else ''}"
-                        f"Address:[/] {wallet['classic_address']}\n",
-                        classes="wallet-info"
-                    ),
-                    Container(
-                        Button(
-                            "Selected" if is_current else "Select",
-                            variant="success" if is_current else "primary",
-                            id=f"select_{wallet['classic_address']}",
-                            disabled=is_current
-                        ),
-                        Button(
-                            "Remove",
-                            variant="error",
-                            id=f"remove_{wallet['classic_address']}"
-                        ),
-                        classes="wallet-buttons"
-                    ),
-                    classes="wallet-item"
-                )
-                wallet_list.mount(wallet_container)
+                address = wallet['classic_address']
+                if address not in self._wallet_rows:
+                    row = self._wallet_rows[address] = self._build_wallet_row(wallet, address == current_wallet)
+                    wallet_containers.append(row)
+
+            if wallet_containers:
+                with self.app.batch_update():
+                    wallet_list.mount(*wallet_containers)
 
         except Exception as e:
             self.notify(f"Error loading wallets: {str(e)}", severity="error")
 
+    def action_refresh(self) -> None:
+        """Fetch fresh balances for every listed wallet."""
+        if self._wallet_rows:
+            self.app.prefetch_balances(list(self._wallet_rows), self._show_balances)
+
+    @staticmethod
+    def _wallet_label(address: str, is_current: bool) -> Text:
+        """Return the address line of a wallet row as a copy the widget can own."""
+        return _wallet_label_text(address, is_current).copy()
+
+    def _build_wallet_row(self, wallet: dict, is_current: bool) -> Container:
+        """Create the row widget for one wallet."""
+        address = wallet['classic_address']
+        return Container(
+            Vertical(
+                Static(self._wallet_label(address, is_current), classes="wallet-label"),
+                Static(
+                    self._format_balance(wallet.get('last_balance'), cached=True),
+                    id=f"balance_{address}"
+                ),
+                classes="wallet-info"
+            ),
+            Container(
+                Button(
+                    "Selected" if is_current else "Select",
+                    variant="success" if is_current else "primary",
+                    id=f"select_{address}",
+                    disabled=is_current
+                ),
+                Button(
+                    "Remove",
+                    variant="error",
+                    id=f"remove_{address}"
+                ),
+                classes="wallet-buttons"
+            ),
+            classes="wallet-item"
+        )
+
+    def _mark_current(self, address: str, is_current: bool) -> None:
+        """Update an existing wallet row in place when it gains or loses current status."""
+        row = self._wallet_rows[address]
+        row.query_one(".wallet-label", Static).update(self._wallet_label(address, is_current))
+        button = row.query_one(f"#select_{address}", Button)
+        button.label = "Selected" if is_current else "Select"
+        button.variant = "success" if is_current else "primary"
+        button.disabled = is_current
+
+    @staticmethod
+    def _format_balance(balance, cached: bool = False) -> str:
+        """Format a wallet balance line, marking values read from the cache."""
+        if balance is None:
+            return "[dim]Balance: unknown[/]"
+        suffix = " [dim](cached)[/]" if cached else ""
+        return f"Balance: {balance} XRP{suffix}"
+
+    def _show_balances(self, balances: dict) -> None:
+        """Replace cached balances with freshly fetched ones."""
+        for address, balance in balances.items():
+            if balance is None:
+                continue
+            try:
+                self.query_one(f"#balance_{address}", Static).update(self._format_balance(balance))
+            except Exception:
+                # The list was rebuilt or the screen closed while fetching
+                pass
+
     def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button presses."""
-        if event.button.id == "back":
-            self.app.pop_screen()
-            self.app.refresh_display()  # Ensure display is refreshed after returning
-        elif event.button.id == "generate":
-            self.app.generate_wallet()
-            self.load_wallets()  # Refresh the list
-        elif event.button.id == "import":
-            self.app.push_screen(ImportWalletScreen())
-        elif event.button.id.startswith("select_"):
-            address = event.button.id.replace("select_", "")
-            self.app.switch_wallet(address)
-            self.load_wallets()  # Refresh the list
-        elif event.button.id.startswith("remove_"):
-            address = event.button.id.replace("remove_", "")
-            self.app.remove_wallet(address)
-            self.load_wallets()  # Refresh the list
+        _dispatch_button(self, event.button.id, self._BUTTON_HANDLERS, self._PREFIX_HANDLERS)
+
+    def _on_back(self) -> None:
+        """Return to the main screen."""
+        self.app.pop_screen()
+        self.app.refresh_display()  # Ensure display is refreshed after returning
+
+    def _on_generate(self) -> None:
+        """Generate a new wallet."""
+        self.app.generate_wallet()
+        self.load_wallets()  # Refresh the list
+
+    def _on_import(self) -> None:
+        """Open the wallet import form."""
+        self.app.push_screen(ImportWalletScreen())
+
+    def _on_select(self, address: str) -> None:
+        """Make the chosen wallet the current one."""
+        self.app.switch_wallet(address)
+        self.load_wallets()  # Refresh the list
+
+    def _on_remove(self, address: str) -> None:
+        """Remove the chosen wallet."""
+        self.app.remove_wallet(address)
+        self.load_wallets()  # Refresh the list
 
     def on_key(self, event: Key) -> None:
         """Handle key presses."""